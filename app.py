@@ -5,6 +5,20 @@
 Flask를 사용한 로컬 서버
 """
 
+# Windows 콘솔 인코딩 문제 해결 (이모지 출력용)
+# 라이브러리 모듈에서 import 시점에 바꾸지 않고, 실행 진입점에서만 설정
+import sys
+import io
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# OpenMP 스레드를 인접 코어에 고정 (faiss/torch가 OpenMP 런타임을 로드하기 전에 설정해야 적용됨)
+# 라이브러리 모듈이 아닌 실행 진입점에서만 설정하며, 사용자 환경변수가 있으면 그대로 사용
+import os
+os.environ.setdefault('OMP_PROC_BIND', 'close')
+os.environ.setdefault('OMP_PLACES', 'cores')
+
 from flask import Flask, render_template, request, jsonify, Response, stream_with_context, send_file
 from company_analyzer import CompanyAnalyzer
 from llm_orchestrator import LLMOrchestrator, GeminiProvider, MidmProvider, PerplexityProvider
@@ -1799,7 +1799,7 @@ XML 뷰어(VS Code, XML Notepad 등)로 열어서 확인하세요.
                 
                 # 먼저 VectorDB 캐시 확인
                 update_status(f"   🔍 VectorDB 캐시 확인 중...")
-                cached_company_reports = self.vector_store.get_naver_reports_from_cache(found_name, "NAVER_COMPANY")
+                cached_company_reports = self.vector_store.get_naver_reports_from_cache(found_name, "NAVER_COMPANY", limit=3)
                 
                 if cached_company_reports and len(cached_company_reports) >= 3:
                     # 캐시에 충분한 리포트가 있으면 사용
@@ -1855,7 +1855,8 @@ XML 뷰어(VS Code, XML Notepad 등)로 열어서 확인하세요.
                 cached_industry_reports = self.vector_store.get_naver_reports_from_cache(
                     company_name=None,  # 산업분석은 회사명 필터링 안 함
                     report_type="NAVER_INDUSTRY",
-                    industry_keywords=industry_keywords
+                    industry_keywords=industry_keywords,
+                    limit=2
                 )
                 
                 if cached_industry_reports and len(cached_industry_reports) >= 2:
@@ -113,12 +113,59 @@ class Config:
     # 임베딩 모델 (한국어 특화)
     EMBEDDING_MODEL: str = 'jhgan/ko-sroberta-multitask'
     
+    # 임베딩 추론 백엔드 ('torch': sentence-transformers, 'onnx': ONNX Runtime + Optimum O3 그래프 최적화)
+    EMBEDDING_BACKEND: str = os.getenv('EMBEDDING_BACKEND', 'torch')
+    
+    # torch 백엔드 임베딩 추론 장치 ('auto': cuda → mps → cpu 순으로 자동 선택, 또는 'cpu'/'cuda'/'mps')
+    EMBEDDING_DEVICE: str = os.getenv('EMBEDDING_DEVICE', 'auto')
+    
+    # torch 백엔드 임베딩 모델 가중치 dtype ('auto': GPU는 float16/그 외 float32, 'float32', 'bfloat16', 'float16')
+    # float32 외 dtype은 sentence-transformers 3.0 이상 필요, bfloat16은 AVX512-BF16/AMX 지원 CPU에서 유리
+    EMBEDDING_DTYPE: str = os.getenv('EMBEDDING_DTYPE', 'auto')
+    
+    # ONNX 변환/최적화된 임베딩 모델 저장 디렉토리 (최초 1회 변환 후 재사용)
+    EMBEDDING_ONNX_DIR: str = os.getenv('EMBEDDING_ONNX_DIR', 'onnx_models')
+    
+    # 검색 쿼리 임베딩 LRU 캐시 크기 (같은 쿼리 재인코딩 방지)
+    QUERY_EMBED_CACHE_SIZE: int = int(os.getenv('QUERY_EMBED_CACHE_SIZE', '1024'))
+    
+    # 시맨틱 검색 결과 캐시 크기 (0이면 사용 안 함) / 캐시 적중 코사인 유사도 임계값
+    SEARCH_CACHE_SIZE: int = int(os.getenv('SEARCH_CACHE_SIZE', '512'))
+    SEARCH_CACHE_THRESHOLD: float = float(os.getenv('SEARCH_CACHE_THRESHOLD', '0.97'))
+    
+    # VectorDB 백그라운드 저장 지연 시간(초) - 마지막 변경 후 이 시간 동안 추가 변경이 없으면 저장
+    VECTOR_FLUSH_DELAY: float = float(os.getenv('VECTOR_FLUSH_DELAY', '2.0'))
+    
     # 텍스트 청크 크기
     CHUNK_SIZE: int = 1000
     
     # 텍스트 청크 오버랩
     CHUNK_OVERLAP: int = 200
     
+    # FAISS 인덱스 종류 ('flat': 전수 탐색, 'hnsw': 그래프 근사 탐색, 'ivfpq': 역색인 + 곱양자화)
+    VECTOR_INDEX_TYPE: str = os.getenv('VECTOR_INDEX_TYPE', 'hnsw')
+    
+    # HNSW 노드당 이웃 수 / 구축 시 탐색 폭 / 검색 시 탐색 폭 (클수록 정확하지만 느림)
+    VECTOR_HNSW_M: int = int(os.getenv('VECTOR_HNSW_M', '32'))
+    VECTOR_HNSW_EF_CONSTRUCTION: int = int(os.getenv('VECTOR_HNSW_EF_CONSTRUCTION', '200'))
+    VECTOR_HNSW_EF_SEARCH: int = int(os.getenv('VECTOR_HNSW_EF_SEARCH', '64'))
+    
+    # FAISS 검색 OpenMP 스레드 수 (0이면 CPU 코어 수의 절반)
+    VECTOR_SEARCH_THREADS: int = int(os.getenv('VECTOR_SEARCH_THREADS', '0'))
+    
+    # IVF 검색 시 탐색할 클러스터 수
+    VECTOR_IVF_NPROBE: int = int(os.getenv('VECTOR_IVF_NPROBE', '16'))
+    
+    # 벡터 양자화 방식 ('none': fp32 원본, 'fp16': 반정밀도(1/2 크기, 학습 불필요),
+    # 'sq8': int8 스칼라 양자화(1/4 크기), 'pq': 곱양자화)
+    # flat/hnsw 인덱스에 적용되며, ivfpq는 항상 PQ 코드를 사용
+    VECTOR_QUANT_MODE: str = os.getenv('VECTOR_QUANT_MODE', 'none')
+    
+    # 학습이 필요한 인덱스(IVF-PQ, 양자화)의 최소 학습 벡터 수
+    # 부족하면 양자화 없는 인덱스로 시작하고, 벡터가 모이면 학습된 인덱스로 교체
+    # PQ 계열(ivfpq, pq)은 코드북 학습 최소치인 256개(2**8) 미만으로 설정해도 256개로 보정
+    VECTOR_TRAIN_MIN_VECTORS: int = int(os.getenv('VECTOR_TRAIN_MIN_VECTORS', '10000'))
+    
     # ============================================
     # Naver Finance Crawler Settings
     # ============================================
@@ -143,6 +190,16 @@ class Config:
     # 다운로드 폴더
     DOWNLOAD_DIR: str = 'downloads'
     
+    # 증권사 리포트 PDF를 디버깅용으로 다운로드 폴더에 저장할지 여부
+    DEBUG_SAVE_PDF: bool = os.getenv('DEBUG_SAVE_PDF', 'False').lower() == 'true'
+    
+    # 네이버 리포트 목록 HTML을 디버깅용으로 다운로드 폴더에 저장할지 여부
+    DEBUG_SAVE_HTML: bool = os.getenv('DEBUG_SAVE_HTML', 'False').lower() == 'true'
+    
+    # 증권사 리포트 PDF 텍스트 추출 프로세스 수 (0이면 다운로드 스레드에서 직접 추출)
+    # spawn 방식 플랫폼(Windows 등)에서는 워커가 실행 스크립트(app.py)를 다시 import하므로 기본값은 0
+    PDF_EXTRACT_PROCESSES: int = int(os.getenv('PDF_EXTRACT_PROCESSES', '0'))
+    
     
     # ============================================
     # Report Settings
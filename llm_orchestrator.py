@@ -5,18 +5,102 @@ LLM Orchestrator
 다양한 LLM Provider를 통합 관리하고, 작업 유형에 따라 적절한 LLM을 자동 선택
 """
 
-# Windows 콘솔 인코딩 문제 해결 (이모지 출력용)
-import sys
-import io
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
-import google.generativeai as genai
-import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import Optional, Dict, Iterator, Mapping
+# google.generativeai / requests는 무거운 의존성이므로 각 Provider 초기화 시점에 import
+from email.utils import parsedate_to_datetime
+import functools
+import hashlib
 import json
+import logging
+import os
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# orjson이 설치되어 있으면 JSON 직렬화/파싱 가속 (선택사항)
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+
+# Gemini 모델 목록 디스크 캐시 (list_models() 네트워크 호출 절약)
+GEMINI_MODELS_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'llm_orchestrator', 'gemini_models.json'
+)
+GEMINI_MODELS_CACHE_TTL = 24 * 60 * 60  # 24시간
+
+# generate_many 최대 동시 요청 수 (HTTP 연결 풀 크기도 이 값에 맞춤)
+LLM_MAX_CONCURRENCY = 16
+
+# Midm 재시도 설정 (429 / 5xx는 지수 백오프 + jitter, Retry-After 헤더 우선)
+MIDM_MAX_ATTEMPTS = 5
+MIDM_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+MIDM_MAX_RETRY_SLEEP = 30
+
+# 응답 앞뒤 공백 판별용 문자 집합
+_WHITESPACE = frozenset(' \t\n\r')
+
+
+def __getattr__(name: str):
+    """기존 코드의 llm_orchestrator.genai / llm_orchestrator.requests 접근 호환"""
+    if name == 'genai':
+        import google.generativeai as genai
+        return genai
+    if name == 'requests':
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _list_gemini_models(api_key_hash: str) -> tuple:
+    """
+    Gemini 모델 목록 조회 (프로세스 메모리 + 디스크 캐시)
+    
+    Args:
+        api_key_hash: API 키 해시 (키별로 캐시 구분)
+    
+    Returns:
+        (model_name, supported_generation_methods) 튜플의 튜플
+    """
+    try:
+        if time.time() - os.path.getmtime(GEMINI_MODELS_CACHE_PATH) < GEMINI_MODELS_CACHE_TTL:
+            with open(GEMINI_MODELS_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('api_key_hash') == api_key_hash:
+                return tuple((name, tuple(methods)) for name, methods in cached['models'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    import google.generativeai as genai
+    
+    models = [
+        (model.name, list(model.supported_generation_methods))
+        for model in genai.list_models()
+    ]
+    
+    try:
+        os.makedirs(os.path.dirname(GEMINI_MODELS_CACHE_PATH), exist_ok=True)
+        with open(GEMINI_MODELS_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'api_key_hash': api_key_hash, 'models': models}, f)
+    except OSError as e:
+        logger.warning("⚠️  Gemini 모델 목록 캐시 저장 실패: %s", e)
+    
+    return tuple((name, tuple(methods)) for name, methods in models)
 
 
 class LLMProvider(ABC):
@@ -27,20 +111,37 @@ class LLMProvider(ABC):
         """텍스트 생성"""
         pass
     
+    def generate_content_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        텍스트 스트리밍 생성 (생성되는 대로 조각 단위로 반환)
+        
+        스트리밍을 지원하지 않는 Provider는 전체 응답을 한 번에 반환합니다.
+        """
+        yield self.generate_content(prompt, **kwargs)
+    
     @abstractmethod
     def get_name(self) -> str:
         """Provider 이름 반환"""
         pass
     
     @abstractmethod
-    def get_capabilities(self) -> dict:
-        """Provider 능력 반환 (context_window, cost, speed 등)"""
+    def get_capabilities(self) -> Mapping:
+        """Provider 능력 반환 (context_window, cost, speed 등, 읽기 전용)"""
         pass
 
 
 class GeminiProvider(LLMProvider):
     """Google Gemini AI Provider"""
     
+    # 호출마다 dict를 새로 만들지 않도록 클래스 수준 읽기 전용 매핑으로 보관
+    _CAPS = MappingProxyType({
+        'context_window': 1_000_000,
+        'supports_long_context': True,
+        'supports_korean': True,
+        'cost': 'medium',
+        'speed': 'fast'
+    })
+    
     def __init__(self, api_key: str, model_candidates: list = None):
         """
         Gemini Provider 초기화
@@ -49,76 +150,152 @@ class GeminiProvider(LLMProvider):
             api_key: Gemini API 키
             model_candidates: 시도할 모델 리스트
         """
-        print("   🔑 Gemini API 키 설정 중...")
+        logger.info("   🔑 Gemini API 키 설정 중...")
+        import google.generativeai as genai
+        from google.api_core import exceptions as google_exceptions
+        self._genai = genai
+        # 다른 후보 모델로 전환할 Gemini 오류 (모델 없음 / 권한 없음)
+        # InvalidArgument는 대부분 프롬프트 문제이므로 모델 미지원 메시지일 때만 전환
+        self._fallback_errors = (
+            google_exceptions.NotFound,
+            google_exceptions.PermissionDenied,
+        )
+        self._invalid_argument_error = google_exceptions.InvalidArgument
         genai.configure(api_key=api_key)
-        print("   ✅ Gemini API 키 설정 완료")
+        self._api_key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+        self._fallback_attempted = False
+        # generate_many 스레드들이 동시에 실패해도 모델 전환은 한 스레드만 수행
+        self._fallback_lock = threading.Lock()
+        logger.info("   ✅ Gemini API 키 설정 완료")
         
-        print("   🤖 Gemini 모델 초기화 중...")
+        logger.info("   🤖 Gemini 모델 초기화 중...")
         self.model = self._initialize_model(model_candidates or ['gemini-2.5-pro-preview-03-25', 'gemini-pro'])
-        print("   ✅ Gemini 모델 초기화 완료")
+        logger.info("   ✅ Gemini 모델 초기화 완료")
     
     def _initialize_model(self, candidates):
-        """사용 가능한 Gemini 모델 자동 선택"""
-        print("🔍 Gemini API 사용 가능한 모델 확인 중...")
+        """
+        첫 번째 후보 모델로 즉시 초기화
         
+        GenerativeModel 생성 자체는 네트워크 호출이 없으므로 테스트 호출 없이 바로 생성하고,
+        실제 사용 가능 여부는 첫 generate_content 호출에서 확인합니다.
+        """
+        self._candidates = list(candidates) or ['gemini-pro']
+        logger.info("✅ Gemini 모델 설정 완료: %s", self._candidates[0])
+        return self._genai.GenerativeModel(self._candidates[0])
+    
+    def _discover_model(self) -> Optional[str]:
+        """list_models() 결과(캐시)에서 generateContent 지원 모델 선택"""
+        logger.info("🔍 Gemini API 사용 가능한 모델 확인 중...")
         try:
-            # 사용 가능한 모델 목록 가져오기
-            available_models = []
-            for model in genai.list_models():
-                if 'generateContent' in model.supported_generation_methods:
-                    available_models.append(model.name)
-                    print(f"   - {model.name}")
-            
-            if available_models:
-                selected_model = available_models[0]
-                model_obj = genai.GenerativeModel(selected_model)
-                print(f"✅ Gemini 모델 설정 완료: {selected_model}")
-                return model_obj
+            for name, methods in _list_gemini_models(self._api_key_hash):
+                if 'generateContent' in methods:
+                    return name
         except Exception as e:
-            print(f"⚠️  모델 목록 조회 실패: {e}")
-            print("   기본 모델로 시도합니다...")
+            logger.warning("⚠️  모델 목록 조회 실패: %s", e)
+        return None
+    
+    def _is_model_unavailable(self, error: Exception) -> bool:
+        """
+        모델 자체를 사용할 수 없는 오류인지 판별 (요청 내용 오류는 False)
+        
+        Args:
+            error: generate_content에서 발생한 예외
+        
+        Returns:
+            다른 후보 모델로 전환해야 하면 True
+        """
+        if isinstance(error, self._fallback_errors):
+            return True
+        if isinstance(error, self._invalid_argument_error):
+            message = str(error).lower()
+            return 'model' in message and ('not supported' in message or 'not found' in message)
+        return False
+    
+    def _fallback_generate(self, prompt: str, error: Exception):
+        """
+        현재 모델 실패 시 나머지 후보 → list_models() 순으로 대체 모델을 찾아 재시도
+        
+        Args:
+            prompt: 재시도할 프롬프트
+            error: 현재 모델에서 발생한 예외
+        
+        Returns:
+            대체 모델의 응답
+        """
+        failed_name = self.model.model_name.replace('models/', '')
+        logger.warning("   ❌ %s 실패: %.100s", failed_name, error)
+        
+        fallback_names = [name for name in self._candidates if name != failed_name]
+        discovered = self._discover_model()
+        if discovered and discovered.replace('models/', '') not in fallback_names + [failed_name]:
+            fallback_names.append(discovered)
         
-        # 기본 모델들 시도
-        for model_name in candidates:
+        for model_name in fallback_names:
             try:
-                test_model = genai.GenerativeModel(model_name)
-                # 실제로 작동하는지 테스트
-                test_response = test_model.generate_content("test")
-                print(f"✅ Gemini 모델 설정 완료: {model_name}")
-                return test_model
+                model = self._genai.GenerativeModel(model_name)
+                response = model.generate_content(prompt)
             except Exception as model_error:
-                print(f"   ❌ {model_name} 실패: {str(model_error)[:100]}")
+                if not self._is_model_unavailable(model_error):
+                    raise
+                logger.warning("   ❌ %s 실패: %.100s", model_name, model_error)
                 continue
+            self.model = model
+            logger.info("✅ Gemini 모델 전환: %s", model_name)
+            return response
         
-        # 모든 시도 실패 시 gemini-pro로 폴백
-        print("⚠️  모든 모델 시도 실패. gemini-pro를 기본값으로 사용합니다.")
-        return genai.GenerativeModel('gemini-pro')
+        raise error
     
     def generate_content(self, prompt: str, **kwargs) -> str:
         """텍스트 생성"""
-        print(f"   🔄 Gemini AI 처리 중... (프롬프트 길이: {len(prompt)}자)")
-        response = self.model.generate_content(prompt)
-        print(f"   ✅ Gemini AI 응답 완료 (응답 길이: {len(response.text)}자)")
+        logger.debug("   🔄 Gemini AI 처리 중... (프롬프트 길이: %s자)", len(prompt))
+        model = self.model
+        try:
+            response = model.generate_content(prompt)
+        except Exception as e:
+            if not self._is_model_unavailable(e):
+                raise
+            with self._fallback_lock:
+                switched_model = self.model if self.model is not model else None
+                if switched_model is None:
+                    # 모델 전환은 프로세스당 한 번만 시도 (반복 실패 시 무한 재시도 방지)
+                    if self._fallback_attempted:
+                        raise
+                    self._fallback_attempted = True
+                    response = self._fallback_generate(prompt, e)
+            if switched_model is not None:
+                # 다른 스레드가 이미 전환한 모델로 한 번만 재시도
+                response = switched_model.generate_content(prompt)
+        logger.debug("   ✅ Gemini AI 응답 완료 (응답 길이: %s자)", len(response.text))
         return response.text
     
+    def generate_content_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """텍스트 스트리밍 생성"""
+        logger.debug("   🔄 Gemini AI 스트리밍 처리 중... (프롬프트 길이: %s자)", len(prompt))
+        for chunk in self.model.generate_content(prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+    
     def get_name(self) -> str:
         """Provider 이름 반환"""
         return "gemini"
     
-    def get_capabilities(self) -> dict:
+    def get_capabilities(self) -> Mapping:
         """Provider 능력 반환"""
-        return {
-            'context_window': 1_000_000,
-            'supports_long_context': True,
-            'supports_korean': True,
-            'cost': 'medium',
-            'speed': 'fast'
-        }
+        return self._CAPS
 
 
 class MidmProvider(LLMProvider):
     """Friendli AI (Midm) Provider"""
     
+    # 호출마다 dict를 새로 만들지 않도록 클래스 수준 읽기 전용 매핑으로 보관
+    _CAPS = MappingProxyType({
+        'context_window': 4096,  # Friendli AI 기본값
+        'supports_long_context': False,
+        'supports_korean': True,
+        'cost': 'low',
+        'speed': 'very_fast'  # Dedicated endpoint라 빠름
+    })
+    
     def __init__(self, api_token: str, base_url: str, endpoint_id: str):
         """
         Midm Provider 초기화
@@ -131,16 +308,104 @@ class MidmProvider(LLMProvider):
         Reference:
             https://friendli.ai/docs/guides/dedicated_endpoints/quickstart
         """
-        print("   🔑 Midm API 토큰 설정 중...")
+        logger.info("   🔑 Midm API 토큰 설정 중...")
         self.api_token = api_token
         self.base_url = base_url.rstrip('/')
         self.endpoint_id = endpoint_id
         self.api_url = f"{self.base_url}/chat/completions"
-        print("   ✅ Midm API 토큰 설정 완료")
+        # 요청마다 재생성하지 않도록 헤더와 세션을 한 번만 구성
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_token}"
+        }
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        self._requests = requests
+        self.session = requests.Session()
+        # 연결 수준 오류는 urllib3에서 재시도, HTTP 상태 재시도는 _post()에서 처리
+        # 풀 크기를 generate_many 동시 요청 수에 맞춰 연결 폐기/재생성 방지 (기본값 10)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=LLM_MAX_CONCURRENCY,
+            pool_maxsize=LLM_MAX_CONCURRENCY,
+            max_retries=Retry(
+                total=3,
+                status=0,
+                backoff_factor=0.5,
+                allowed_methods=frozenset(['POST'])
+            )
+        ))
+        logger.info("   ✅ Midm API 토큰 설정 완료")
         
-        print(f"   🔧 Midm Provider 초기화 완료")
-        print(f"   📍 Endpoint ID: {endpoint_id}")
-        print(f"   🌐 API URL: {self.api_url}")
+        logger.info("   🔧 Midm Provider 초기화 완료")
+        logger.info("   📍 Endpoint ID: %s", endpoint_id)
+        logger.info("   🌐 API URL: %s", self.api_url)
+    
+    @staticmethod
+    def _retry_delay(response, attempt: int) -> float:
+        """
+        재시도 대기 시간 계산
+        
+        Retry-After 헤더(초 또는 HTTP 날짜)가 있으면 그 값을 따르고,
+        없으면 지수 백오프 + jitter를 사용합니다.
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(MIDM_MAX_RETRY_SLEEP, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    return min(MIDM_MAX_RETRY_SLEEP, max(0.0, delay))
+                except (TypeError, ValueError):
+                    pass
+        return min(MIDM_MAX_RETRY_SLEEP, (2 ** attempt) + random.random())
+    
+    def _post(self, payload: dict, stream: bool = False):
+        """
+        API 요청 (429 / 5xx 응답은 백오프 후 재시도)
+        
+        Args:
+            payload: 요청 페이로드
+            stream: 응답 스트리밍 여부
+        
+        Returns:
+            마지막 응답 (재시도 소진 시 실패 응답 그대로 반환)
+        """
+        data = _json_dumps(payload)
+        for attempt in range(MIDM_MAX_ATTEMPTS):
+            response = self.session.post(
+                self.api_url,
+                data=data,
+                headers=self._headers,
+                timeout=(10, 30),
+                stream=stream
+            )
+            if response.status_code not in MIDM_RETRY_STATUS or attempt == MIDM_MAX_ATTEMPTS - 1:
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            logger.warning(
+                "   ⏳ HTTP %s - %.1f초 후 재시도 (%s/%s)",
+                response.status_code, delay, attempt + 1, MIDM_MAX_ATTEMPTS - 1
+            )
+            response.close()
+            time.sleep(delay)
+    
+    def _build_payload(self, prompt: str, **kwargs) -> dict:
+        """요청 페이로드 생성 (가이드에 나온 페이로드 형식 그대로)"""
+        return {
+            "model": self.endpoint_id,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": kwargs.get('max_tokens', 512),
+            "temperature": kwargs.get('temperature', 0.7),
+            "top_p": kwargs.get('top_p', 0.9),
+        }
     
     def generate_content(self, prompt: str, **kwargs) -> str:
         """
@@ -154,87 +419,98 @@ class MidmProvider(LLMProvider):
             생성된 텍스트
         """
         try:
-            # 가이드에 나온 형식: Authorization Bearer 토큰
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_token}"
-            }
+            payload = self._build_payload(prompt, **kwargs)
             
-            # 가이드에 나온 페이로드 형식 그대로
-            payload = {
-                "model": self.endpoint_id,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": kwargs.get('max_tokens', 512),
-                "temperature": kwargs.get('temperature', 0.7),
-                "top_p": kwargs.get('top_p', 0.9),
-            }
+            response = self._post(payload)
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            # 응답 본문은 한 번만 파싱해서 오류/성공 경로 모두에서 재사용
+            try:
+                result = _json_loads(response.content)
+            except ValueError:
+                result = None
             
             if response.status_code != 200:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    error_msg += f": {error_detail}"
-                except:
-                    error_msg += f": {response.text[:200]}"
-                print(f"   ❌ {error_msg}")
+                logger.error(
+                    "   ❌ HTTP %s: %s", response.status_code,
+                    result if result is not None else response.text[:200]
+                )
             
             response.raise_for_status()
             
-            result = response.json()
-            
             # 가이드의 응답 형식: choices[0].message.content
-            if 'choices' in result and len(result['choices']) > 0:
-                message = result['choices'][0].get('message', {})
-                content = message.get('content', '')
-                if content:
-                    return content.strip()
+            try:
+                content = result["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                raise ValueError(f"예상치 못한 응답 형식: {result}")
+            if not content:
+                raise ValueError(f"예상치 못한 응답 형식: {result}")
             
-            raise ValueError(f"예상치 못한 응답 형식: {result}")
+            # 앞뒤 공백이 없으면 strip() 복사 없이 그대로 반환
+            if content[0] in _WHITESPACE or content[-1] in _WHITESPACE:
+                return content.strip()
+            return content
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Midm API 요청 오류: {e}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.json()
-                    error_msg += f"\n   상세: {error_detail}"
-                except:
-                    error_msg += f"\n   응답: {e.response.text[:300]}"
-            print(f"❌ {error_msg}")
+        except self._requests.exceptions.RequestException as e:
+            # HTTP 오류 응답 상세는 위에서 이미 기록했으므로 다시 파싱하지 않음
+            logger.error("❌ Midm API 요청 오류: %s", e)
             raise
         except Exception as e:
-            print(f"❌ Midm API 처리 오류: {e}")
+            logger.error("❌ Midm API 처리 오류: %s", e)
             raise
     
+    def generate_content_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        텍스트 스트리밍 생성 (Server-Sent Events)
+        
+        Args:
+            prompt: 생성할 프롬프트
+            **kwargs: 추가 파라미터 (max_tokens, temperature, top_p 등)
+        
+        Yields:
+            생성된 텍스트 조각
+        """
+        payload = self._build_payload(prompt, **kwargs)
+        payload["stream"] = True
+        
+        with self._post(payload, stream=True) as response:
+            if response.status_code != 200:
+                logger.error("   ❌ HTTP %s: %.200s", response.status_code, response.text)
+            response.raise_for_status()
+            
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                chunk = _json_loads(data)
+                choices = chunk.get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content", "")
+                if content:
+                    yield content
+    
     def get_name(self) -> str:
         """Provider 이름 반환"""
         return "midm"
     
-    def get_capabilities(self) -> dict:
+    def get_capabilities(self) -> Mapping:
         """Provider 능력 반환"""
-        return {
-            'context_window': 4096,  # Friendli AI 기본값
-            'supports_long_context': False,
-            'supports_korean': True,
-            'cost': 'low',
-            'speed': 'very_fast'  # Dedicated endpoint라 빠름
-        }
+        return self._CAPS
 
 
 class PerplexityProvider(LLMProvider):
     """Perplexity AI Provider"""
     
+    # 호출마다 dict를 새로 만들지 않도록 클래스 수준 읽기 전용 매핑으로 보관
+    _CAPS = MappingProxyType({
+        'context_window': 128_000,  # Perplexity 128k 모델
+        'supports_long_context': True,
+        'supports_korean': True,
+        'cost': 'medium',
+        'speed': 'fast',
+        'supports_web_search': True  # Perplexity의 주요 특징
+    })
+    
     def __init__(self, api_key: str):
         """
         Perplexity Provider 초기화
@@ -245,13 +521,15 @@ class PerplexityProvider(LLMProvider):
         Reference:
             https://docs.perplexity.ai/
         """
-        print("   🔑 Perplexity API 키 설정 중...")
+        logger.info("   🔑 Perplexity API 키 설정 중...")
         self.api_key = api_key
         self.api_url = "https://api.perplexity.ai/chat/completions"
-        print("   ✅ Perplexity API 키 설정 완료")
+        import requests
+        self._requests = requests
+        logger.info("   ✅ Perplexity API 키 설정 완료")
         
-        print(f"   🔧 Perplexity Provider 초기화 완료")
-        print(f"   🌐 API URL: {self.api_url}")
+        logger.info("   🔧 Perplexity Provider 초기화 완료")
+        logger.info("   🌐 API URL: %s", self.api_url)
     
     def generate_content(self, prompt: str, **kwargs) -> str:
         """
@@ -284,12 +562,12 @@ class PerplexityProvider(LLMProvider):
             }
             
             # 디버깅용 로그
-            print(f"   🔍 Perplexity API 요청 디버깅:")
-            print(f"   📍 URL: {self.api_url}")
-            print(f"   🔑 API Key: {self.api_key[:10]}...")
-            print(f"   📦 Payload: {payload}")
+            logger.debug("   🔍 Perplexity API 요청 디버깅:")
+            logger.debug("   📍 URL: %s", self.api_url)
+            logger.debug("   🔑 API Key: %.10s...", self.api_key)
+            logger.debug("   📦 Payload: %s", payload)
             
-            response = requests.post(
+            response = self._requests.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
@@ -300,16 +578,16 @@ class PerplexityProvider(LLMProvider):
                 error_msg = f"HTTP {response.status_code}"
                 try:
                     error_detail = response.json()
-                    print(f"   📋 Perplexity API 응답 상세: {error_detail}")
+                    logger.debug("   📋 Perplexity API 응답 상세: %s", error_detail)
                     if 'error' in error_detail:
                         error_msg += f": {error_detail['error']}"
                     else:
                         error_msg += f": {error_detail}"
                 except:
                     error_msg += f": {response.text[:500]}"
-                    print(f"   📋 Perplexity API 원본 응답: {response.text[:500]}")
-                print(f"   ❌ Perplexity API 오류: {error_msg}")
-                print(f"   📋 요청 payload: {payload}")
+                    logger.debug("   📋 Perplexity API 원본 응답: %.500s", response.text)
+                logger.error("   ❌ Perplexity API 오류: %s", error_msg)
+                logger.debug("   📋 요청 payload: %s", payload)
                 
                 # 특정 에러 코드에 대한 처리
                 if response.status_code == 401:
@@ -336,7 +614,7 @@ class PerplexityProvider(LLMProvider):
             else:
                 raise ValueError(f"Perplexity API 응답에 choices가 없습니다: {result}")
                 
-        except requests.exceptions.RequestException as e:
+        except self._requests.exceptions.RequestException as e:
             error_msg = f"Perplexity API 요청 오류: {e}"
             if hasattr(e, 'response') and e.response is not None:
                 try:
@@ -344,36 +622,65 @@ class PerplexityProvider(LLMProvider):
                     error_msg += f"\n   상세: {error_detail}"
                 except:
                     error_msg += f"\n   응답: {e.response.text[:300]}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise
         except Exception as e:
-            print(f"❌ Perplexity API 처리 오류: {e}")
+            logger.error("❌ Perplexity API 처리 오류: %s", e)
             raise
     
     def get_name(self) -> str:
         """Provider 이름 반환"""
         return "perplexity"
     
-    def get_capabilities(self) -> dict:
+    def get_capabilities(self) -> Mapping:
         """Provider 능력 반환"""
-        return {
-            'context_window': 128_000,  # Perplexity 128k 모델
-            'supports_long_context': True,
-            'supports_korean': True,
-            'cost': 'medium',
-            'speed': 'fast',
-            'supports_web_search': True  # Perplexity의 주요 특징
-        }
+        return self._CAPS
+
+
+class _TokenBucket:
+    """분당 요청 수 제한용 토큰 버킷 (여러 스레드에서 공유)"""
+    
+    def __init__(self, rate_per_min: int):
+        self.capacity = float(rate_per_min)
+        self.tokens = float(rate_per_min)
+        self.fill_rate = rate_per_min / 60.0
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
 
 
 class LLMOrchestrator:
     """LLM Provider 관리 및 자동 선택"""
     
-    def __init__(self):
-        """Orchestrator 초기화"""
+    def __init__(self, rate_limit_per_min: Optional[int] = None):
+        """
+        Orchestrator 초기화
+        
+        Args:
+            rate_limit_per_min: generate_many 배치 요청의 분당 최대 요청 수 (None이면 제한 없음)
+        """
         self.providers: Dict[str, LLMProvider] = {}
         self.default_provider: Optional[str] = None
         self.task_routing: Dict[str, str] = {}
+        # 등록 시점에 구성하는 능력별 인덱스 (select_provider에서 O(1) 조회)
+        self._capability_cache: Dict[str, Mapping] = {}
+        self._long_context_providers: list = []
+        self._fast_providers: list = []
+        # generate_many 배치 처리용 (첫 배치 호출 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._rate_limiter = _TokenBucket(rate_limit_per_min) if rate_limit_per_min else None
     
     def register_provider(self, provider: LLMProvider, is_default: bool = False):
         """
@@ -385,11 +692,30 @@ class LLMOrchestrator:
         """
         name = provider.get_name()
         self.providers[name] = provider
-        print(f"✅ LLM Provider 등록: {name}")
+        self._index_capabilities(name, provider.get_capabilities())
+        logger.info("✅ LLM Provider 등록: %s", name)
         
         if is_default or self.default_provider is None:
             self.default_provider = name
-            print(f"   📌 기본 Provider 설정: {name}")
+            logger.info("   📌 기본 Provider 설정: %s", name)
+    
+    def _index_capabilities(self, name: str, caps: Mapping):
+        """
+        Provider 능력을 인덱스에 반영 (등록 순서 유지)
+        
+        Args:
+            name: Provider 이름
+            caps: get_capabilities() 결과
+        """
+        self._capability_cache[name] = caps
+        for index, matched in (
+            (self._long_context_providers, caps.get('supports_long_context')),
+            (self._fast_providers, caps.get('speed') in ('fast', 'very_fast')),
+        ):
+            if name in index:
+                index.remove(name)
+            if matched:
+                index.append(name)
     
     def set_task_routing(self, task_type: str, provider_name: str):
         """
@@ -402,7 +728,7 @@ class LLMOrchestrator:
         if provider_name not in self.providers:
             raise ValueError(f"Provider '{provider_name}' 미등록")
         self.task_routing[task_type] = provider_name
-        print(f"   🔀 라우팅 설정: {task_type} → {provider_name}")
+        logger.info("   🔀 라우팅 설정: %s → %s", task_type, provider_name)
     
     def select_provider(self, task_type: Optional[str] = None) -> LLMProvider:
         """
@@ -417,29 +743,29 @@ class LLMOrchestrator:
         # 1. 작업 유형별 라우팅이 설정되어 있으면 해당 Provider 사용
         if task_type and task_type in self.task_routing:
             provider_name = self.task_routing[task_type]
-            print(f"   🔀 라우팅 적용: {task_type} → {provider_name}")
+            logger.debug("   🔀 라우팅 적용: %s → %s", task_type, provider_name)
             return self.providers[provider_name]
         
         # 2. 작업 유형별 자동 선택 로직 (향후 확장)
         if task_type == 'long_context_analysis':
-            # 긴 컨텍스트는 Gemini 우선
-            for name, provider in self.providers.items():
-                if provider.get_capabilities().get('supports_long_context'):
-                    return provider
+            # 긴 컨텍스트는 Gemini 우선 (등록 순서상 첫 번째 long-context Provider)
+            if self._long_context_providers:
+                return self.providers[self._long_context_providers[0]]
         
         elif task_type == 'quick_analysis':
-            # 빠른 분석은 속도 우선 (향후: Claude-Haiku, GPT-3.5 등)
-            pass
+            # 빠른 분석은 속도 우선 (등록 순서상 첫 번째 fast/very_fast Provider)
+            if self._fast_providers:
+                return self.providers[self._fast_providers[0]]
         
         # 3. 기본 Provider 사용
         if self.default_provider and self.default_provider in self.providers:
-            print(f"   🔀 기본 Provider 사용: {self.default_provider}")
+            logger.debug("   🔀 기본 Provider 사용: %s", self.default_provider)
             return self.providers[self.default_provider]
         
         # 4. 아무 Provider라도 반환 (폴백)
         if self.providers:
             fallback_name = list(self.providers.keys())[0]
-            print(f"   🔀 폴백 Provider 사용: {fallback_name}")
+            logger.debug("   🔀 폴백 Provider 사용: %s", fallback_name)
             return list(self.providers.values())[0]
         
         raise RuntimeError("등록된 LLM Provider가 없습니다.")
@@ -457,10 +783,91 @@ class LLMOrchestrator:
             생성된 텍스트
         """
         provider = self.select_provider(task_type)
-        print(f"🤖 사용 LLM: {provider.get_name().upper()}")
-        print(f"📝 작업 유형: {task_type or '기본'}")
+        logger.debug("🤖 사용 LLM: %s", provider.get_name().upper())
+        logger.debug("📝 작업 유형: %s", task_type or '기본')
         return provider.generate_content(prompt, **kwargs)
     
+    def generate_stream(self, prompt: str, task_type: Optional[str] = None, **kwargs) -> Iterator[str]:
+        """
+        텍스트 스트리밍 생성 (자동 Provider 선택)
+        
+        Args:
+            prompt: 생성할 프롬프트
+            task_type: 작업 유형 (선택사항)
+            **kwargs: 추가 파라미터
+            
+        Yields:
+            생성된 텍스트 조각
+        """
+        provider = self.select_provider(task_type)
+        logger.debug("🤖 사용 LLM: %s (스트리밍)", provider.get_name().upper())
+        logger.debug("📝 작업 유형: %s", task_type or '기본')
+        yield from provider.generate_content_stream(prompt, **kwargs)
+    
+    def _generate_limited(self, prompt: str, task_type: Optional[str], **kwargs) -> str:
+        """요청 수 제한을 적용한 generate (배치 작업 스레드에서 호출)"""
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
+        return self.generate(prompt, task_type, **kwargs)
+    
+    def generate_many(self, prompts: list, task_type: Optional[str] = None,
+                      max_workers: int = LLM_MAX_CONCURRENCY, **kwargs) -> list:
+        """
+        여러 프롬프트를 스레드 풀로 동시에 처리 (네트워크 I/O 대기 중첩)
+        
+        Args:
+            prompts: 프롬프트 리스트
+            task_type: 작업 유형 (선택사항)
+            max_workers: 이 호출의 최대 동시 요청 수 (LLM_MAX_CONCURRENCY 이하)
+            **kwargs: 추가 파라미터
+            
+        Returns:
+            입력 순서와 같은 순서의 생성 텍스트 리스트
+            
+        Raises:
+            Exception: 요청 하나라도 실패하면 아직 시작하지 않은 요청을 취소하고 그 예외를 전파
+        """
+        if not prompts:
+            return []
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="llm")
+        
+        # 공유 스레드 풀에 max_workers개까지만 제출하고, 하나가 끝날 때마다 다음 프롬프트를 제출
+        window = max(1, min(max_workers, LLM_MAX_CONCURRENCY))
+        queued = iter(enumerate(prompts))
+        running = {}
+        
+        def submit_next():
+            item = next(queued, None)
+            if item is not None:
+                i, prompt = item
+                running[self._executor.submit(self._generate_limited, prompt, task_type, **kwargs)] = i
+        
+        for _ in range(window):
+            submit_next()
+        
+        results = [None] * len(prompts)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception:
+                    # 실패 시 나머지 요청이 계속 과금되지 않도록 대기 중인 요청 취소
+                    for pending in running:
+                        pending.cancel()
+                    raise
+                submit_next()
+        return results
+    
+    def shutdown(self):
+        """배치 처리용 스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
     def list_providers(self) -> list:
         """
         등록된 Provider 목록 반환
@@ -471,7 +878,7 @@ class LLMOrchestrator:
         return [
             {
                 'name': name,
-                'capabilities': provider.get_capabilities(),
+                'capabilities': dict(self._capability_cache[name]),  # JSON 직렬화 가능한 복사본
                 'is_default': name == self.default_provider
             }
             for name, provider in self.providers.items()
@@ -6,17 +6,151 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gc
+import json
 import os
+import threading
 import time
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, quote
+from datetime import datetime
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse
 import fitz  # PyMuPDF
 from config import config
 
 
+# PDF 스트리밍 다운로드 청크 크기
+PDF_CHUNK_SIZE = 64 * 1024
+
+# 서버가 요청 속도를 늦추라고 응답하는 상태 코드
+THROTTLE_STATUS = frozenset({429, 503})
+
+# PyMuPDF(fitz)는 스레드 안전하지 않으므로 프로세스 내 fitz 호출을 직렬화
+# (다운로드 스레드들이 동시에 추출하더라도 fitz 작업은 한 번에 하나씩)
+_fitz_lock = threading.Lock()
+
+# PDF 추출 N건마다 GC + MuPDF 내부 저장소 정리 (장시간 실행 시 메모리 증가 완화)
+PDF_GC_INTERVAL = 10
+
+# 프로세스별 PDF 추출 작업 카운터 (PDF_GC_INTERVAL마다 메모리 정리)
+_pdf_jobs_since_gc = 0
+_pdf_gc_lock = threading.Lock()
+
+
+def _release_pdf_memory():
+    """
+    PDF_GC_INTERVAL건마다 GC 실행 및 MuPDF 내부 캐시(store) 비우기
+    
+    fitz 호출이므로 반드시 _fitz_lock을 잡은 상태에서 호출해야 합니다.
+    """
+    global _pdf_jobs_since_gc
+    with _pdf_gc_lock:
+        _pdf_jobs_since_gc += 1
+        if _pdf_jobs_since_gc < PDF_GC_INTERVAL:
+            return
+        _pdf_jobs_since_gc = 0
+    
+    gc.collect()
+    fitz.TOOLS.store_shrink(100)
+
+
+def _extract_text(pdf_bytes, display_name=''):
+    """
+    PDF 바이트 데이터에서 텍스트 추출 (프로세스 풀에서 실행 가능하도록 모듈 수준 함수)
+    
+    Args:
+        pdf_bytes: PDF 바이트 데이터 (bytes / bytearray)
+        display_name: 로그에 표시할 이름
+        
+    Returns:
+        str: 추출된 텍스트 (실패 시 빈 문자열)
+    """
+    print(f"      📄 PDF 텍스트 추출 중: {display_name}")
+    parts = []  # 문자열 += 누적 대신 리스트에 모아 한 번에 join
+    
+    with _fitz_lock:
+        try:
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+                total_pages = doc.page_count
+                
+                for page_idx in range(total_pages):
+                    page = doc.load_page(page_idx)
+                    parts.append(f"\n--- 페이지 {page_idx + 1} ---\n")
+                    parts.append(page.get_text("text"))
+                    page = None  # 페이지 객체 즉시 해제
+                    
+                    if (page_idx + 1) % 10 == 0:
+                        print(f"         ✓ {page_idx + 1}/{total_pages} 페이지 처리 완료")
+            
+            return "".join(parts)
+            
+        except Exception as e:
+            print(f"      ❌ PDF 텍스트 추출 실패: {e}")
+            return ""
+        finally:
+            # 다른 스레드가 fitz를 사용 중이지 않도록 락 안에서 저장소 정리
+            _release_pdf_memory()
+
+
 class NaverFinanceCrawler:
     """네이버 금융 증권사 리포트 크롤러"""
     
+    # 검색 요청 공통 파라미터 (keyword만 검색어별로 채움)
+    _COMPANY_PARAMS = {
+        'searchType': 'keyword',
+        'brokerCode': '',
+        'writeFromDate': '',
+        'writeToDate': '',
+        'itemName': '',
+        'itemCode': '',
+    }
+    _INDUSTRY_PARAMS = {
+        'searchType': 'keyword',
+        'brokerCode': '',
+        'writeFromDate': '',
+        'writeToDate': '',
+        'upjong': '',
+    }
+    
+    # 목록 유형별 검색 설정 (columns: 헤더를 못 찾았을 때 사용할 기본 열 위치)
+    _LISTING_SPECS = {
+        'company': {
+            'url': "https://finance.naver.com/research/company_list.naver",
+            'params': _COMPANY_PARAMS,
+            'debug_html': 'downloads/debug_company_list.html',
+            'min_cells': 5,
+            'columns': {'종목명': 0, '제목': 1, '증권사': 2, '첨부': 3, '작성일': 4},
+        },
+        'industry': {
+            'url': "https://finance.naver.com/research/industry_list.naver",
+            'params': _INDUSTRY_PARAMS,
+            'debug_html': 'downloads/debug_industry_list.html',
+            'min_cells': 4,
+            'columns': {'제목': 0, '증권사': 1, '첨부': 2, '작성일': 3},
+        },
+    }
+    
+    # 검색어 동시 조회 최대 수
+    MAX_SEARCH_WORKERS = 3
+    
+    # PDF 동시 다운로드 최대 수
+    MAX_PDF_WORKERS = 4
+    
+    # 호스트별 최대 동시 요청 수
+    MAX_CONNECTIONS_PER_HOST = 4
+    
+    # 429/503 응답 시 해당 호스트 요청을 멈추는 시간 (지수 백오프, 초)
+    THROTTLE_BACKOFF_BASE = 1.0
+    THROTTLE_BACKOFF_MAX = 60.0
+    
+    # LLM 회사명 변형 결과 캐시 파일 (프로세스 재시작 후에도 재사용)
+    VARIATION_CACHE_PATH = os.path.join(config.DOWNLOAD_DIR, '.variation_cache.json')
+    
     def __init__(self, llm_orchestrator=None):
         """
         초기화
@@ -32,11 +166,153 @@ class NaverFinanceCrawler:
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
             'Referer': config.NAVER_FINANCE_BASE_URL
         }
+        
+        # 세션 재사용 (keep-alive로 같은 호스트에 대한 TCP/TLS 핸드셰이크 절약)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # 목록 HTML(finance.naver.com)과 PDF(stock.pstatic.net)는 호스트가 다르므로
+        # 호스트별 어댑터로 연결 풀을 분리해 번갈아 요청해도 연결이 밀려나지 않도록 함
+        for prefix, pool_maxsize in (
+            ('https://', 20),
+            ('https://finance.naver.com', self.MAX_SEARCH_WORKERS + 1),
+            ('https://stock.pstatic.net', self.MAX_PDF_WORKERS * 2),
+        ):
+            self.session.mount(prefix, HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                    raise_on_status=False  # 재시도 소진 시 마지막 응답을 돌려받아 백오프에 반영
+                )
+            ))
+        
+        # 호스트별 동시 요청 제한 + 429/503 응답 시에만 대기하는 적응형 속도 제한
+        self._limiter = {
+            'finance.naver.com': threading.Semaphore(self.MAX_CONNECTIONS_PER_HOST),
+            'stock.pstatic.net': threading.Semaphore(self.MAX_CONNECTIONS_PER_HOST),
+        }
+        self._next_ok_at = {}
+        self._throttle_strikes = {}
+        self._limiter_lock = threading.Lock()
+        
+        # PDF 텍스트 추출용 프로세스 풀 (선택사항, 첫 사용 시 생성)
+        self._extract_pool = None
+        self._extract_pool_lock = threading.Lock()
+        
+        # 회사명 → LLM 추천 검색어 캐시 (키: 소문자/공백 제거한 회사명)
+        self._variation_cache = self._load_variation_cache()
+    
+    def close(self, wait=True):
+        """
+        HTTP 세션 및 PDF 추출 프로세스 풀 종료
+        
+        Args:
+            wait: 진행 중인 PDF 추출 작업 완료까지 대기할지 여부
+                  (False면 대기 중인 작업을 취소하고 바로 반환 - 소멸자용)
+        """
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+            self.session = None
+        
+        pool = getattr(self, '_extract_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._extract_pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        # GC/인터프리터 종료 중에는 추출 작업을 기다리지 않음
+        try:
+            self.close(wait=False)
+        except Exception:
+            pass
+    
+    @contextmanager
+    def _host_slot(self, url):
+        """
+        호스트별 요청 슬롯 획득 (동시 요청 수 제한)
+        
+        서버가 429/503으로 속도 조절을 요구한 경우에만 지정된 시각까지 대기합니다.
+        """
+        host = urlparse(url).hostname or ''
+        with self._limiter_lock:
+            semaphore = self._limiter.get(host)
+            if semaphore is None:
+                semaphore = self._limiter[host] = threading.Semaphore(self.MAX_CONNECTIONS_PER_HOST)
+        
+        with semaphore:
+            wait = self._next_ok_at.get(host, 0) - time.monotonic()
+            if wait > 0:
+                print(f"      ⏳ {host} 요청 제한으로 {wait:.1f}초 대기")
+                time.sleep(wait)
+            yield
+    
+    def _record_response(self, url, response):
+        """응답 상태에 따라 호스트별 백오프 갱신 (429/503이면 대기 시간 설정, 성공이면 초기화)"""
+        host = urlparse(url).hostname or ''
+        with self._limiter_lock:
+            if response.status_code not in THROTTLE_STATUS:
+                self._throttle_strikes.pop(host, None)
+                return
+            
+            strikes = self._throttle_strikes.get(host, 0)
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(float(retry_after), self.THROTTLE_BACKOFF_MAX)
+            else:
+                delay = min(self.THROTTLE_BACKOFF_BASE * (2 ** strikes), self.THROTTLE_BACKOFF_MAX)
+            self._throttle_strikes[host] = strikes + 1
+            self._next_ok_at[host] = time.monotonic() + delay
+    
+    @staticmethod
+    def _parse_date_key(date_str):
+        """
+        YY.MM.DD 형식 날짜를 정렬용 정수(ordinal)로 변환
+        
+        Args:
+            date_str: 리포트 작성일 (예: "24.05.17")
+            
+        Returns:
+            int: 날짜 ordinal (파싱 실패 또는 "날짜미상"이면 0)
+        """
+        try:
+            return datetime.strptime(date_str, '%y.%m.%d').toordinal()
+        except (TypeError, ValueError):
+            return 0
+    
+    def _load_variation_cache(self):
+        """디스크에 저장된 회사명 변형 캐시 로드 (없거나 손상되면 빈 캐시)"""
+        try:
+            with open(self.VARIATION_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_variation_cache(self):
+        """회사명 변형 캐시를 디스크에 저장"""
+        try:
+            os.makedirs(os.path.dirname(self.VARIATION_CACHE_PATH), exist_ok=True)
+            with open(self.VARIATION_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self._variation_cache, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"   ⚠️  검색어 캐시 저장 실패: {e}")
     
     def _get_company_name_variations(self, company_name):
         """
         LLM Orchestrator를 사용하여 회사명의 다양한 표기 가져오기
         
+        같은 회사명에 대한 결과는 캐시하여 LLM을 다시 호출하지 않습니다.
+        
         Args:
             company_name: 입력된 회사명
             
@@ -46,6 +322,12 @@ class NaverFinanceCrawler:
         if not self.llm_orchestrator:
             return [company_name]
         
+        cache_key = company_name.strip().lower()
+        cached = self._variation_cache.get(cache_key)
+        if cached:
+            print(f"   💾 캐시된 검색어 사용: {cached}")
+            return list(cached)
+        
         try:
             prompt = f"""
 한국 상장회사 "{company_name}"의 공식 명칭과 가능한 모든 표기 방법을 나열해주세요.
@@ -73,41 +355,318 @@ class NaverFinanceCrawler:
                 variations.insert(0, company_name)
             
             print(f"   🤖 LLM 추천 검색어: {variations}")
-            return variations
+            
+            self._variation_cache[cache_key] = variations
+            self._save_variation_cache()
+            return list(variations)
             
         except Exception as e:
             print(f"   ⚠️  LLM 검색어 추천 실패: {e}")
             return [company_name]
     
-    def _extract_text_from_pdf(self, pdf_path):
+    def _get_extract_pool(self):
+        """PDF 텍스트 추출용 프로세스 풀 (config.PDF_EXTRACT_PROCESSES > 0일 때만, 첫 사용 시 생성)"""
+        workers = min(getattr(config, 'PDF_EXTRACT_PROCESSES', 0), os.cpu_count() or 1)
+        if workers <= 0:
+            return None
+        with self._extract_pool_lock:
+            if self._extract_pool is None:
+                self._extract_pool = ProcessPoolExecutor(max_workers=workers)
+            return self._extract_pool
+    
+    def _extract_text_from_pdf(self, pdf_bytes, display_name):
         """
-        PDF 파일에서 텍스트 추출
+        메모리의 PDF 데이터에서 텍스트 추출 (임시 파일 없이)
+        
+        프로세스 풀이 설정되어 있으면 다른 프로세스에서 추출하여, 다운로드 스레드는
+        다음 PDF를 계속 받을 수 있고 여러 PDF를 여러 코어에서 동시에 처리합니다.
         
         Args:
-            pdf_path: PDF 파일 경로
+            pdf_bytes: PDF 바이트 데이터 (bytes / bytearray)
+            display_name: 로그에 표시할 이름
             
         Returns:
             str: 추출된 텍스트
         """
+        pool = self._get_extract_pool()
+        if pool is not None:
+            try:
+                return pool.submit(_extract_text, bytes(pdf_bytes), display_name).result()
+            except BrokenProcessPool as e:
+                print(f"      ⚠️  PDF 추출 프로세스 오류, 현재 프로세스에서 재시도: {e}")
+        return _extract_text(pdf_bytes, display_name)
+    
+    def _download_and_extract(self, report, idx, total, file_prefix):
+        """
+        리포트 PDF 다운로드 → 메모리에서 텍스트 추출
+        
+        Args:
+            report: 리포트 정보 dict (title, broker, date, pdf_url, [stock_name])
+            idx: 리포트 순번 (1부터)
+            total: 전체 리포트 수
+            file_prefix: 디버그용 PDF 저장 시 파일명 접두사
+            
+        Returns:
+            dict: {name, date, content, url, [stock_name]} (실패 시 None)
+        """
         try:
-            print(f"      📄 PDF 텍스트 추출 중: {os.path.basename(pdf_path)}")
-            text = ""
+            with self._host_slot(report['pdf_url']):
+                print(f"\n   [{idx}/{total}] PDF 다운로드 중: {report['title'][:50]}...")
+                
+                # PDF 다운로드 (64KB 단위로 받아 메모리 버퍼에 누적)
+                pdf_data = bytearray()
+                with self.session.get(report['pdf_url'], stream=True, timeout=60) as pdf_response:
+                    self._record_response(report['pdf_url'], pdf_response)
+                    pdf_response.raise_for_status()
+                    for chunk in pdf_response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                        pdf_data += chunk
+            
+            print(f"      💾 PDF 다운로드: {len(pdf_data):,} bytes")
+            
+            # 디버그용 PDF 저장 (기본값: 저장 안 함)
+            if getattr(config, 'DEBUG_SAVE_PDF', False):
+                pdf_filename = f"downloads/{file_prefix}_{idx}_{int(time.time())}.pdf"
+                os.makedirs('downloads', exist_ok=True)
+                with open(pdf_filename, 'wb') as f:
+                    f.write(pdf_data)
+                print(f"      🔍 PDF 저장됨: {pdf_filename}")
+            
+            # 텍스트 추출 (파일 왕복 없이 메모리에서 바로 파싱)
+            text_content = self._extract_text_from_pdf(pdf_data, report['title'][:50])
+            
+            if not text_content:
+                print(f"      ⚠️  텍스트 추출 실패")
+                return None
+            
+            extracted = {
+                'name': f"[{report['broker']}] {report['title']}",
+                'date': report['date'],
+                'content': text_content,
+                'url': report['pdf_url']
+            }
+            if 'stock_name' in report:
+                extracted['stock_name'] = report['stock_name']
+            print(f"      ✅ 텍스트 추출 완료: {len(text_content):,}자")
+            return extracted
+            
+        except Exception as download_error:
+            print(f"      ❌ 다운로드 실패: {download_error}")
+            return None
+    
+    def _download_reports(self, selected_reports, file_prefix):
+        """
+        선정된 리포트들의 PDF를 병렬로 다운로드하고 텍스트 추출
+        
+        Args:
+            selected_reports: 리포트 정보 리스트 (최신순)
+            file_prefix: 디버그용 PDF 저장 시 파일명 접두사
+            
+        Returns:
+            list: 추출에 성공한 리포트 리스트 (입력 순서 유지)
+        """
+        if not selected_reports:
+            return []
+        
+        total = len(selected_reports)
+        results = [None] * total
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PDF_WORKERS, total)) as executor:
+            futures = {
+                executor.submit(self._download_and_extract, report, i, total, file_prefix): i
+                for i, report in enumerate(selected_reports, 1)
+            }
+            for future in as_completed(futures):
+                results[futures[future] - 1] = future.result()
+        
+        return [report for report in results if report]
+    
+    def _fetch_listing(self, list_type, search_term, save_debug_html=False):
+        """
+        리포트 목록 페이지 1개를 조회하여 리포트 정보 파싱
+        
+        Args:
+            list_type: 'company' (종목분석) 또는 'industry' (산업분석)
+            search_term: 검색어
+            save_debug_html: 디버깅용 HTML 저장 및 헤더 출력 여부
+            
+        Returns:
+            list: [{[stock_name], title, broker, date, pdf_url}, ...] (실패 시 빈 리스트)
+        """
+        spec = self._LISTING_SPECS[list_type]
+        
+        try:
+            # 검색어는 EUC-KR 바이트로 전달 (requests가 바이트 그대로 %-인코딩)
+            params = {**spec['params'], 'keyword': search_term.encode('euc-kr')}
+            
+            # 검색 페이지 로드
+            with self._host_slot(spec['url']):
+                response = self.session.get(spec['url'], params=params, timeout=30)
+            self._record_response(spec['url'], response)
+            response.raise_for_status()
+            
+            # lexbor 파서: 트리는 C 쪽에 두고 접근하는 노드만 Python 객체로 생성
+            tree = LexborHTMLParser(response.content.decode('euc-kr', errors='replace'))
+            
+            # HTML 디버깅 파일 저장 (원본 바이트 그대로, EUC-KR)
+            if save_debug_html:
+                debug_html_path = spec['debug_html']
+                os.makedirs('downloads', exist_ok=True)
+                with open(debug_html_path, 'wb') as f:
+                    f.write(response.content)
+                print(f"      🔍 HTML 저장됨: {debug_html_path}")
+            
+            # 테이블 찾기
+            table = tree.css_first('table.type_1')
+            if not table:
+                tables = tree.css('table')
+                for t in tables:
+                    rows = t.css('tr')
+                    if len(rows) > 5:
+                        table = t
+                        break
+            
+            if not table:
+                print(f"      ⚠️  '{search_term}': 테이블을 찾을 수 없습니다")
+                return []
             
-            with fitz.open(pdf_path) as doc:
-                total_pages = len(doc)
+            rows = table.css('tr')
+            
+            # 헤더 분석
+            header_map = {}
+            if len(rows) > 0:
+                header_cells = rows[0].css('td, th')
+                for idx, cell in enumerate(header_cells):
+                    header_map[cell.text(strip=True)] = idx
+                if save_debug_html:
+                    print(f"      📊 헤더: {len(header_cells)}개 열 {list(header_map)}")
+            
+            columns = {
+                column: header_map.get(column, default_idx)
+                for column, default_idx in spec['columns'].items()
+            }
+            stock_idx = columns.get('종목명')
+            title_idx = columns['제목']
+            broker_idx = columns['증권사']
+            pdf_idx = columns['첨부']
+            date_idx = columns['작성일']
+            
+            # 리포트 파싱 (예외 대신 명시적 조건으로 건너뛰기)
+            min_cells = max(spec['min_cells'], title_idx + 1, pdf_idx + 1)
+            listing_urls = set()
+            reports = []
+            for row in rows[1:]:  # 헤더 제외
+                cells = row.css('td')
+                if len(cells) < min_cells:
+                    continue
                 
-                for page_num, page in enumerate(doc, 1):
-                    page_text = page.get_text()
-                    text += f"\n--- 페이지 {page_num} ---\n{page_text}"
-                    
-                    if page_num % 10 == 0:
-                        print(f"         ✓ {page_num}/{total_pages} 페이지 처리 완료")
+                # 제목 (링크)
+                title_link = cells[title_idx].css_first('a')
+                if not title_link:
+                    continue
                 
-                return text
+                # PDF 첨부
+                pdf_link = cells[pdf_idx].css_first('a')
+                if not pdf_link:
+                    continue
+                pdf_url = pdf_link.attributes.get('href')
+                if not pdf_url:
+                    continue
                 
-        except Exception as e:
-            print(f"      ❌ PDF 텍스트 추출 실패: {e}")
-            return ""
+                # 절대 URL로 변환
+                if not pdf_url.startswith('http'):
+                    if pdf_url.startswith('//'):
+                        pdf_url = 'https:' + pdf_url
+                    else:
+                        pdf_url = urljoin('https://stock.pstatic.net', pdf_url)
+                
+                # 중복 체크 (텍스트 추출 전에 먼저 확인)
+                if pdf_url in listing_urls:
+                    continue
+                
+                title = title_link.text(strip=True)
+                if not title:
+                    continue
+                listing_urls.add(pdf_url)
+                
+                # 증권사
+                broker = cells[broker_idx].text(strip=True) if len(cells) > broker_idx else "증권사"
+                
+                # 작성일
+                date = cells[date_idx].text(strip=True) if len(cells) > date_idx else "날짜미상"
+                
+                report = {
+                    'title': title,
+                    'broker': broker,
+                    'date': date,
+                    'pdf_url': pdf_url
+                }
+                if stock_idx is not None:
+                    report['stock_name'] = cells[stock_idx].text(strip=True) if len(cells) > stock_idx else ""
+                reports.append(report)
+            
+            return reports
+            
+        except Exception as search_error:
+            print(f"      ⚠️  '{search_term}' 검색 실패: {search_error}")
+            return []
+    
+    def _search_listings(self, list_type, search_variations, max_reports):
+        """
+        여러 검색어로 리포트 목록을 동시에 조회하고 중복 제거하여 병합
+        
+        Args:
+            list_type: 'company' (종목분석) 또는 'industry' (산업분석)
+            search_variations: 검색어 리스트
+            max_reports: 최대 다운로드 수 (2배 이상 모이면 남은 검색 중단)
+            
+        Returns:
+            list: 중복 제거된 리포트 정보 리스트 (검색어 순서 → 목록 페이지 행 순서)
+        """
+        if not search_variations:
+            return []
+        
+        # pdf_url → ((검색어 순번, 행 순번), 리포트): 완료 순서와 관계없이 같은 결과가 나오도록
+        # 중복 시 앞선 검색어/행의 리포트를 남기고, 반환 시 이 순서로 정렬
+        reports_by_url = {}
+        
+        print(f"\n   🔍 검색어 {len(search_variations)}개로 동시 검색 중: {search_variations}")
+        
+        # config.DEBUG_SAVE_HTML이 켜져 있으면 첫 번째 검색어의 HTML만 디버깅 파일로 저장
+        save_debug_html = getattr(config, 'DEBUG_SAVE_HTML', False)
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_SEARCH_WORKERS, len(search_variations))) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_listing, list_type, search_term,
+                    save_debug_html and variation_idx == 0
+                ): (variation_idx, search_term)
+                for variation_idx, search_term in enumerate(search_variations)
+            }
+            
+            for future in as_completed(futures):
+                variation_idx, search_term = futures[future]
+                found_count = 0
+                for row_idx, report in enumerate(future.result()):
+                    order = (variation_idx, row_idx)
+                    # 중복 체크 (앞선 검색어/행에서 찾은 리포트 우선)
+                    existing = reports_by_url.get(report['pdf_url'])
+                    if existing is None:
+                        found_count += 1
+                    elif existing[0] < order:
+                        continue
+                    reports_by_url[report['pdf_url']] = (order, report)
+                
+                print(f"      ✓ '{search_term}': {found_count}개 리포트 발견")
+                
+                # 충분한 리포트를 찾으면 남은 검색 취소
+                if len(reports_by_url) >= max_reports * 2:
+                    print(f"      ℹ️  충분한 리포트 수집, 검색 중단")
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
+        # 호출자의 날짜 정렬은 안정 정렬이므로 같은 날짜는 이 순서(검색어 → 행)를 유지
+        return [report for _, report in sorted(reports_by_url.values(), key=itemgetter(0))]
     
     def search_company_reports(self, company_name, max_reports=5):
         """
@@ -130,160 +689,17 @@ class NaverFinanceCrawler:
             else:
                 search_variations = [company_name]
             
-            # 네이버 증권 종목분석 리포트 검색 URL
-            base_url = "https://finance.naver.com/research/company_list.naver"
-            
-            # 모든 검색어로 검색 시도
-            all_reports = []
-            seen_urls = set()  # 중복 제거용
-            
-            for variation_idx, search_term in enumerate(search_variations):
-                print(f"\n   🔍 [{variation_idx + 1}/{len(search_variations)}] 검색어 '{search_term}'로 검색 중...")
-                
-                try:
-                    # 검색어 EUC-KR 인코딩
-                    keyword_euckr = search_term.encode('euc-kr')
-                    encoded_keyword = quote(keyword_euckr)
-                    
-                    # URL 직접 구성
-                    search_url = f"{base_url}?searchType=keyword&keyword={encoded_keyword}&brokerCode=&writeFromDate=&writeToDate=&itemName=&itemCode="
-                    
-                    print(f"      EUC-KR 인코딩: {encoded_keyword}")
-                    
-                    # 검색 페이지 로드
-                    response = requests.get(search_url, headers=self.headers, timeout=30)
-                    response.raise_for_status()
-                    response.encoding = 'euc-kr'
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # 첫 번째 검색어일 때만 HTML 디버깅 파일 저장
-                    if variation_idx == 0:
-                        debug_html_path = 'downloads/debug_company_list.html'
-                        os.makedirs('downloads', exist_ok=True)
-                        with open(debug_html_path, 'w', encoding='utf-8') as f:
-                            f.write(soup.prettify())
-                        print(f"      🔍 HTML 저장됨: {debug_html_path}")
-                    
-                    # 테이블 찾기
-                    table = soup.find('table', class_='type_1')
-                    if not table:
-                        tables = soup.find_all('table')
-                        for t in tables:
-                            rows = t.find_all('tr')
-                            if len(rows) > 5:
-                                table = t
-                                break
-                    
-                    if not table:
-                        print(f"      ⚠️  테이블을 찾을 수 없습니다")
-                        continue
-                    
-                    rows = table.find_all('tr')
-                    
-                    # 헤더 분석 (첫 검색어일 때만)
-                    if variation_idx == 0:
-                        header_map = {}
-                        if len(rows) > 0:
-                            first_row = rows[0]
-                            header_cells = first_row.find_all(['td', 'th'])
-                            print(f"      📊 헤더: {len(header_cells)}개 열")
-                            for idx, cell in enumerate(header_cells):
-                                header_text = cell.get_text(strip=True)
-                                header_map[header_text] = idx
-                                print(f"         열 {idx}: '{header_text}'")
-                        
-                        stock_idx = header_map.get('종목명', 0)
-                        title_idx = header_map.get('제목', 1)
-                        broker_idx = header_map.get('증권사', 2)
-                        pdf_idx = header_map.get('첨부', 3)
-                        date_idx = header_map.get('작성일', 4)
-                    
-                    # 리포트 파싱
-                    found_count = 0
-                    for row in rows[1:]:  # 헤더 제외
-                        try:
-                            cells = row.find_all('td')
-                            if len(cells) < 5:
-                                continue
-                            
-                            # 데이터 추출
-                            stock_name = cells[stock_idx].get_text(strip=True) if len(cells) > stock_idx else ""
-                            
-                            title_cell = cells[title_idx]
-                            title_link = title_cell.find('a')
-                            if not title_link:
-                                continue
-                            
-                            title = title_link.get_text(strip=True)
-                            if not title:
-                                continue
-                            
-                            broker = cells[broker_idx].get_text(strip=True) if len(cells) > broker_idx else "증권사"
-                            
-                            pdf_cell = cells[pdf_idx]
-                            pdf_link = pdf_cell.find('a')
-                            if not pdf_link or not pdf_link.get('href'):
-                                continue
-                            
-                            pdf_url = pdf_link.get('href')
-                            
-                            # 절대 URL로 변환
-                            if not pdf_url.startswith('http'):
-                                if pdf_url.startswith('//'):
-                                    pdf_url = 'https:' + pdf_url
-                                else:
-                                    pdf_url = urljoin('https://stock.pstatic.net', pdf_url)
-                            
-                            # 중복 체크
-                            if pdf_url in seen_urls:
-                                continue
-                            seen_urls.add(pdf_url)
-                            
-                            date = cells[date_idx].get_text(strip=True) if len(cells) > date_idx else "날짜미상"
-                            
-                            all_reports.append({
-                                'stock_name': stock_name,
-                                'title': title,
-                                'broker': broker,
-                                'date': date,
-                                'pdf_url': pdf_url
-                            })
-                            
-                            found_count += 1
-                            
-                        except Exception as row_error:
-                            continue
-                    
-                    print(f"      ✓ {found_count}개 리포트 발견")
-                    
-                    # 충분한 리포트를 찾으면 중단
-                    if len(all_reports) >= max_reports * 2:
-                        print(f"      ℹ️  충분한 리포트 수집, 검색 중단")
-                        break
-                    
-                    # 다음 검색어 사이에 짧은 지연
-                    time.sleep(0.5)
-                    
-                except Exception as search_error:
-                    print(f"      ⚠️  검색 실패: {search_error}")
-                    continue
+            # 모든 검색어로 동시에 검색 (목록 페이지 요청은 서로 독립적인 I/O)
+            all_reports = self._search_listings('company', search_variations, max_reports)
             
             if not all_reports:
                 print(f"\n   ⚠️  '{company_name}'에 대한 리포트를 찾을 수 없습니다.")
                 return []
             
-            # 날짜 기준으로 정렬 (최신순)
-            def parse_date(date_str):
-                """YY.MM.DD 형식을 정렬 가능한 값으로 변환"""
-                try:
-                    if not date_str or date_str == "날짜미상":
-                        return "00.00.00"
-                    return date_str
-                except:
-                    return "00.00.00"
-            
-            all_reports.sort(key=lambda x: parse_date(x['date']), reverse=True)
+            # 날짜 기준으로 정렬 (최신순, 정렬 키는 리포트당 한 번만 계산)
+            for report in all_reports:
+                report['_sort_key'] = self._parse_date_key(report['date'])
+            all_reports.sort(key=itemgetter('_sort_key'), reverse=True)
             
             # 상위 N개만 선택
             selected_reports = all_reports[:max_reports]
@@ -296,53 +712,8 @@ class NaverFinanceCrawler:
                 print(f"          PDF: {report['pdf_url'][:80]}...")
             print()
             
-            # PDF 다운로드 및 텍스트 추출
-            extracted_reports = []
-            
-            for i, report in enumerate(selected_reports, 1):
-                try:
-                    print(f"\n   [{i}/{len(selected_reports)}] PDF 다운로드 중: {report['title'][:50]}...")
-                    
-                    # PDF 다운로드
-                    pdf_response = requests.get(report['pdf_url'], headers=self.headers, timeout=60)
-                    pdf_response.raise_for_status()
-                    
-                    # 임시 PDF 파일 저장
-                    pdf_filename = f"downloads/naver_report_{i}_{int(time.time())}.pdf"
-                    os.makedirs('downloads', exist_ok=True)
-                    
-                    with open(pdf_filename, 'wb') as f:
-                        f.write(pdf_response.content)
-                    
-                    print(f"      💾 PDF 저장: {len(pdf_response.content):,} bytes")
-                    
-                    # 텍스트 추출
-                    text_content = self._extract_text_from_pdf(pdf_filename)
-                    
-                    if text_content:
-                        extracted_reports.append({
-                            'name': f"[{report['broker']}] {report['title']}",
-                            'date': report['date'],
-                            'content': text_content,
-                            'url': report['pdf_url'],
-                            'stock_name': report['stock_name']
-                        })
-                        print(f"      ✅ 텍스트 추출 완료: {len(text_content):,}자")
-                    else:
-                        print(f"      ⚠️  텍스트 추출 실패")
-                    
-                    # PDF 파일 삭제
-                    try:
-                        os.remove(pdf_filename)
-                    except:
-                        pass
-                    
-                    # 짧은 지연
-                    time.sleep(1)
-                    
-                except Exception as download_error:
-                    print(f"      ❌ 다운로드 실패: {download_error}")
-                    continue
+            # PDF 다운로드 및 텍스트 추출 (병렬)
+            extracted_reports = self._download_reports(selected_reports, 'naver_report')
             
             print(f"\n   ✅ 최종 {len(extracted_reports)}개 리포트 추출 완료")
             return extracted_reports
@@ -373,159 +744,17 @@ class NaverFinanceCrawler:
             # 검색어 리스트로 사용
             search_variations = industry_keywords
             
-            # 네이버 증권 산업분석 리포트 검색 URL
-            base_url = "https://finance.naver.com/research/industry_list.naver"
-            
-            # 모든 검색어로 검색 시도
-            all_reports = []
-            seen_urls = set()  # 중복 제거용
-            
-            for variation_idx, search_term in enumerate(search_variations):
-                print(f"\n   🔍 [{variation_idx + 1}/{len(search_variations)}] 검색어 '{search_term}'로 검색 중...")
-                
-                try:
-                    # 검색어 EUC-KR 인코딩
-                    keyword_euckr = search_term.encode('euc-kr')
-                    encoded_keyword = quote(keyword_euckr)
-                    
-                    # URL 직접 구성
-                    search_url = f"{base_url}?searchType=keyword&keyword={encoded_keyword}&brokerCode=&writeFromDate=&writeToDate=&upjong="
-                    
-                    print(f"      EUC-KR 인코딩: {encoded_keyword}")
-                    
-                    # 검색 페이지 로드
-                    response = requests.get(search_url, headers=self.headers, timeout=30)
-                    response.raise_for_status()
-                    response.encoding = 'euc-kr'
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # 첫 번째 검색어일 때만 HTML 디버깅 파일 저장
-                    if variation_idx == 0:
-                        debug_html_path = 'downloads/debug_industry_list.html'
-                        os.makedirs('downloads', exist_ok=True)
-                        with open(debug_html_path, 'w', encoding='utf-8') as f:
-                            f.write(soup.prettify())
-                        print(f"      🔍 HTML 저장됨: {debug_html_path}")
-                    
-                    # 테이블 찾기
-                    table = soup.find('table', class_='type_1')
-                    if not table:
-                        tables = soup.find_all('table')
-                        for t in tables:
-                            rows = t.find_all('tr')
-                            if len(rows) > 5:
-                                table = t
-                                break
-                    
-                    if not table:
-                        print(f"      ⚠️  테이블을 찾을 수 없습니다")
-                        continue
-                    
-                    rows = table.find_all('tr')
-                    
-                    # 헤더 분석 (첫 검색어일 때만)
-                    if variation_idx == 0:
-                        header_map = {}
-                        if len(rows) > 0:
-                            first_row = rows[0]
-                            header_cells = first_row.find_all(['td', 'th'])
-                            print(f"      📊 헤더: {len(header_cells)}개 열")
-                            for idx, cell in enumerate(header_cells):
-                                header_text = cell.get_text(strip=True)
-                                header_map[header_text] = idx
-                                print(f"         열 {idx}: '{header_text}'")
-                        
-                        title_idx = header_map.get('제목', 0)
-                        broker_idx = header_map.get('증권사', 1)
-                        pdf_idx = header_map.get('첨부', 2)
-                        date_idx = header_map.get('작성일', 3)
-                    
-                    # 리포트 파싱
-                    found_count = 0
-                    for row in rows[1:]:  # 헤더 제외
-                        try:
-                            cells = row.find_all('td')
-                            if len(cells) < 4:
-                                continue
-                            
-                            # 제목 (링크)
-                            title_cell = cells[title_idx]
-                            title_link = title_cell.find('a')
-                            if not title_link:
-                                continue
-                            
-                            title = title_link.get_text(strip=True)
-                            if not title:
-                                continue
-                            
-                            # 증권사
-                            broker = cells[broker_idx].get_text(strip=True) if len(cells) > broker_idx else "증권사"
-                            
-                            # PDF 첨부
-                            pdf_cell = cells[pdf_idx]
-                            pdf_link = pdf_cell.find('a')
-                            if not pdf_link or not pdf_link.get('href'):
-                                continue
-                            
-                            pdf_url = pdf_link.get('href')
-                            
-                            # 절대 URL로 변환
-                            if not pdf_url.startswith('http'):
-                                if pdf_url.startswith('//'):
-                                    pdf_url = 'https:' + pdf_url
-                                else:
-                                    pdf_url = urljoin('https://stock.pstatic.net', pdf_url)
-                            
-                            # 중복 체크
-                            if pdf_url in seen_urls:
-                                continue
-                            seen_urls.add(pdf_url)
-                            
-                            # 작성일
-                            date = cells[date_idx].get_text(strip=True) if len(cells) > date_idx else "날짜미상"
-                            
-                            all_reports.append({
-                                'title': title,
-                                'broker': broker,
-                                'date': date,
-                                'pdf_url': pdf_url
-                            })
-                            
-                            found_count += 1
-                            
-                        except Exception as row_error:
-                            continue
-                    
-                    print(f"      ✓ {found_count}개 리포트 발견")
-                    
-                    # 충분한 리포트를 찾으면 중단
-                    if len(all_reports) >= max_reports * 2:
-                        print(f"      ℹ️  충분한 리포트 수집, 검색 중단")
-                        break
-                    
-                    # 다음 검색어 사이에 짧은 지연
-                    time.sleep(0.5)
-                    
-                except Exception as search_error:
-                    print(f"      ⚠️  검색 실패: {search_error}")
-                    continue
+            # 모든 검색어로 동시에 검색 (목록 페이지 요청은 서로 독립적인 I/O)
+            all_reports = self._search_listings('industry', search_variations, max_reports)
             
             if not all_reports:
-                print(f"\n   ⚠️  '{company_name}'에 대한 산업분석 리포트를 찾을 수 없습니다.")
+                print(f"\n   ⚠️  '{', '.join(industry_keywords)}'에 대한 산업분석 리포트를 찾을 수 없습니다.")
                 return []
             
-            # 날짜 기준으로 정렬 (최신순)
-            def parse_date(date_str):
-                """YY.MM.DD 형식을 정렬 가능한 값으로 변환"""
-                try:
-                    if not date_str or date_str == "날짜미상":
-                        return "00.00.00"
-                    return date_str
-                except:
-                    return "00.00.00"
-            
-            all_reports.sort(key=lambda x: parse_date(x['date']), reverse=True)
+            # 날짜 기준으로 정렬 (최신순, 정렬 키는 리포트당 한 번만 계산)
+            for report in all_reports:
+                report['_sort_key'] = self._parse_date_key(report['date'])
+            all_reports.sort(key=itemgetter('_sort_key'), reverse=True)
             
             # 상위 N개만 선택
             selected_reports = all_reports[:max_reports]
@@ -538,52 +767,8 @@ class NaverFinanceCrawler:
                 print(f"          PDF: {report['pdf_url'][:80]}...")
             print()
             
-            # PDF 다운로드 및 텍스트 추출
-            extracted_reports = []
-            
-            for i, report in enumerate(selected_reports, 1):
-                try:
-                    print(f"\n   [{i}/{len(selected_reports)}] PDF 다운로드 중: {report['title'][:50]}...")
-                    
-                    # PDF 다운로드
-                    pdf_response = requests.get(report['pdf_url'], headers=self.headers, timeout=60)
-                    pdf_response.raise_for_status()
-                    
-                    # 임시 PDF 파일 저장
-                    pdf_filename = f"downloads/naver_industry_{i}_{int(time.time())}.pdf"
-                    os.makedirs('downloads', exist_ok=True)
-                    
-                    with open(pdf_filename, 'wb') as f:
-                        f.write(pdf_response.content)
-                    
-                    print(f"      💾 PDF 저장: {len(pdf_response.content):,} bytes")
-                    
-                    # 텍스트 추출
-                    text_content = self._extract_text_from_pdf(pdf_filename)
-                    
-                    if text_content:
-                        extracted_reports.append({
-                            'name': f"[{report['broker']}] {report['title']}",
-                            'date': report['date'],
-                            'content': text_content,
-                            'url': report['pdf_url']
-                        })
-                        print(f"      ✅ 텍스트 추출 완료: {len(text_content):,}자")
-                    else:
-                        print(f"      ⚠️  텍스트 추출 실패")
-                    
-                    # PDF 파일 삭제
-                    try:
-                        os.remove(pdf_filename)
-                    except:
-                        pass
-                    
-                    # 짧은 지연
-                    time.sleep(1)
-                    
-                except Exception as download_error:
-                    print(f"      ❌ 다운로드 실패: {download_error}")
-                    continue
+            # PDF 다운로드 및 텍스트 추출 (병렬)
+            extracted_reports = self._download_reports(selected_reports, 'naver_industry')
             
             print(f"\n   ✅ 최종 {len(extracted_reports)}개 리포트 추출 완료")
             return extracted_reports
@@ -5,9 +5,41 @@
 프롬프트를 JSON 파일에서 로드하고 관리합니다.
 """
 
+import functools
 import json
 import os
-from typing import Dict, List, Optional
+import string
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# orjson이 설치되어 있으면 JSON 파싱 가속 (선택사항)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# str.format 변환 플래그 (!r, !s, !a)
+_CONVERTERS = {'r': repr, 's': str, 'a': ascii}
+
+# 렌더링 결과 캐시 크기 (긴 보고서 본문이 들어가는 프롬프트도 있으므로 작게 유지)
+RENDER_CACHE_SIZE = 128
+
+
+def _compile_template(template: str) -> Optional[List[Tuple]]:
+    """
+    템플릿을 (literal, field_name, format_spec, conversion) 목록으로 미리 파싱
+    
+    위치 인자, 속성/인덱스 접근, 중첩 format_spec 등 단순하지 않은 필드가 있으면
+    None을 반환하고 str.format을 그대로 사용합니다.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None:
+            if not field_name.isidentifier() or (format_spec and '{' in format_spec):
+                return None
+        parts.append((literal, field_name, format_spec, conversion))
+    return parts
+
 
 class PromptManager:
     """프롬프트 템플릿 관리 클래스"""
@@ -21,6 +53,10 @@ class PromptManager:
         """
         self.prompts_file = prompts_file
         self.prompts: Dict = {}
+        self._compiled: Dict[str, Optional[List[Tuple]]] = {}
+        self._required: Dict[str, FrozenSet[str]] = {}
+        # 인스턴스별 렌더링 캐시 (같은 프롬프트 + 같은 변수 → 같은 결과)
+        self._render_cached = functools.lru_cache(maxsize=RENDER_CACHE_SIZE)(self._render)
         self.load_prompts()
     
     def load_prompts(self):
@@ -29,8 +65,18 @@ class PromptManager:
             if not os.path.exists(self.prompts_file):
                 raise FileNotFoundError(f"프롬프트 파일을 찾을 수 없습니다: {self.prompts_file}")
             
-            with open(self.prompts_file, 'r', encoding='utf-8') as f:
-                self.prompts = json.load(f)
+            self.prompts = _json_loads(Path(self.prompts_file).read_bytes())
+            
+            # 필수 변수는 로드 시점에 집합으로 미리 계산
+            self._required = {
+                name: frozenset(data.get('variables', []))
+                for name, data in self.prompts.items()
+            }
+            self._compiled = {
+                name: _compile_template(data.get('template', ''))
+                for name, data in self.prompts.items()
+            }
+            self._render_cached.cache_clear()
             
             print(f"✅ 프롬프트 로드 완료: {len(self.prompts)}개")
         except Exception as e:
@@ -51,21 +97,40 @@ class PromptManager:
         if prompt_name not in self.prompts:
             raise ValueError(f"프롬프트를 찾을 수 없습니다: {prompt_name}")
         
-        prompt_data = self.prompts[prompt_name]
-        template = prompt_data.get('template', '')
-        required_vars = prompt_data.get('variables', [])
-        
         # 필수 변수 확인
-        missing_vars = [var for var in required_vars if var not in kwargs]
+        missing_vars = self._required[prompt_name] - kwargs.keys()
         if missing_vars:
-            raise ValueError(f"필수 변수가 누락되었습니다: {missing_vars}")
+            raise ValueError(f"필수 변수가 누락되었습니다: {sorted(missing_vars)}")
         
-        # 템플릿 변수 채우기
+        # 템플릿 변수 채우기 (해시 가능한 변수는 캐시 사용)
         try:
-            return template.format(**kwargs)
+            try:
+                return self._render_cached(prompt_name, tuple(sorted(kwargs.items())))
+            except TypeError:
+                return self._render_uncached(prompt_name, kwargs)
         except KeyError as e:
             raise ValueError(f"템플릿 변수 오류: {e}")
     
+    def _render(self, prompt_name: str, items: Tuple) -> str:
+        """캐시용 렌더링 (items: 정렬된 (변수명, 값) 튜플)"""
+        return self._render_uncached(prompt_name, dict(items))
+    
+    def _render_uncached(self, prompt_name: str, kwargs: Dict) -> str:
+        """미리 파싱한 템플릿 조각을 이어 붙여 렌더링 (필드 파싱 생략)"""
+        compiled = self._compiled.get(prompt_name)
+        if compiled is None:
+            return self.prompts[prompt_name].get('template', '').format(**kwargs)
+        
+        out = []
+        for literal, field_name, format_spec, conversion in compiled:
+            out.append(literal)
+            if field_name is not None:
+                value = kwargs[field_name]
+                if conversion:
+                    value = _CONVERTERS[conversion](value)
+                out.append(format(value, format_spec))
+        return "".join(out)
+    
     def get_description(self, prompt_name: str) -> str:
         """
         프롬프트 설명 반환
@@ -6,17 +6,401 @@ FAISS와 LangChain을 사용하여 공시보고서를 벡터DB에 저장하고 
 """
 
 import os
+import re
 import json
+import atexit
+import logging
+import heapq
+import math
 import pickle
-from typing import List, Dict, Optional, Tuple
+import shutil
+import threading
+import uuid
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+import faiss
+import numpy as np
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_community.docstore.base import AddableMixin, Docstore
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from config import config
 
+logger = logging.getLogger(__name__)
+
+# orjson이 설치되어 있으면 메타데이터 직렬화/파싱 가속 (선택사항)
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# zstandard가 설치되어 있으면 보고서 원문을 압축 저장 (선택사항)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# pyarrow가 설치되어 있으면 청크 docstore를 pickle 대신 Arrow IPC 파일로 저장 (선택사항)
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# 증권사 리포트 rcept_no 접두어 (리포트 유형별 인덱스 키)
+NAVER_REPORT_TYPES = ("NAVER_COMPANY", "NAVER_INDUSTRY")
+
+
+# 인덱스 재구축 시 한 번에 임베딩할 청크 수 / FAISS 인덱스에 한 번에 추가할 벡터 수
+REBUILD_EMBED_BATCH = 256
+# 보고서 추가 시 한 번에 임베딩할 청크 수
+ADD_EMBED_BATCH = 64
+INDEX_ADD_BATCH = 10000
+# PQ 코드 비트 수 (코드북 학습에 최소 2**PQ_NBITS개 벡터 필요)
+PQ_NBITS = 8
+
+# 임베딩 배치 패딩 길이 버킷 (비슷한 길이끼리 묶어 패딩 토큰 연산 최소화)
+EMBEDDING_LENGTH_BUCKETS = (16, 32, 64, 128, 256, 512)
+
+
+def _bucket_length(length: int, max_length: int) -> int:
+    """토큰 길이를 감싸는 가장 작은 버킷 길이 (max_length 이하)"""
+    for bucket in EMBEDDING_LENGTH_BUCKETS:
+        if length <= bucket:
+            return min(bucket, max_length)
+    return max_length
+
+
+def _date_sort_key(date_str: Optional[str]) -> str:
+    """
+    보고서 날짜를 정렬 가능한 ISO 문자열로 변환 (최신순 정렬용)
+    
+    Args:
+        date_str: 'YY.MM.DD'(네이버), 'YYYYMMDD'(DART), 'YYYY-MM-DD' 등
+        
+    Returns:
+        str: 'YYYY-MM-DD' (알 수 없는 날짜는 가장 오래된 값 '0000-00-00')
+    """
+    if not date_str or date_str == "날짜미상":
+        return "0000-00-00"
+    
+    digits = re.sub(r'\D', '', date_str)
+    if len(digits) == 8:
+        return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+    if len(digits) == 6:
+        return f"20{digits[:2]}-{digits[2:4]}-{digits[4:]}"
+    return date_str
+
+
+def _pq_subquantizers(dim: int) -> int:
+    """PQ 서브양자화기 개수 (서브벡터당 16차원 기준, dim의 약수)"""
+    m = max(1, dim // 16)
+    while dim % m:
+        m -= 1
+    return m
+
+
+class ONNXEmbeddings(Embeddings):
+    """
+    ONNX Runtime 기반 문장 임베딩 (HuggingFaceEmbeddings 대체)
+    
+    Optimum으로 모델을 ONNX로 변환하고 O3 그래프 최적화(attention/GELU/LayerNorm 융합)를
+    적용한 뒤, sentence-transformers와 같은 mean pooling + L2 정규화로 임베딩을 만든다.
+    O4(fp16)는 고정 패딩/GPU가 필요하므로 사용하지 않는다.
+    """
+    
+    def __init__(self, model_name: str, cache_dir: str, batch_size: int = 32, max_length: int = 128):
+        """
+        Args:
+            model_name: HuggingFace 모델 ID
+            cache_dir: 변환/최적화된 ONNX 모델 저장 디렉토리
+            batch_size: 인코딩 배치 크기
+            max_length: 최대 토큰 길이 (ko-sroberta-multitask의 max_seq_length와 동일)
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTOptimizer
+        from optimum.onnxruntime.configuration import AutoOptimizationConfig
+        from transformers import AutoTokenizer
+        
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        
+        model_dir = os.path.join(cache_dir, model_name.replace('/', '__'))
+        optimized_file = "model_optimized.onnx"
+        
+        if not os.path.exists(os.path.join(model_dir, optimized_file)):
+            print(f"🔧 임베딩 모델 ONNX 변환 및 O3 최적화 중... (최초 1회)")
+            model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            optimizer = ORTOptimizer.from_pretrained(model)
+            optimizer.optimize(save_dir=model_dir, optimization_config=AutoOptimizationConfig.O3())
+        
+        self.model = ORTModelForFeatureExtraction.from_pretrained(model_dir, file_name=optimized_file)
+    
+    @property
+    def dimension(self) -> int:
+        """임베딩 차원 (mean pooling이므로 hidden size와 같음)"""
+        return self.model.config.hidden_size
+    
+    @staticmethod
+    def _mean_pooling(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """패딩 토큰을 제외한 토큰 임베딩 평균"""
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        return summed / np.clip(mask.sum(axis=1), 1e-9, None)
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 배치 인코딩 → L2 정규화된 float32 행렬
+        
+        전체를 패딩 없이 한 번 토큰화한 뒤 토큰 길이순으로 정렬해 배치를 만들고,
+        각 배치는 길이 버킷(EMBEDDING_LENGTH_BUCKETS)까지만 패딩한다.
+        결과는 원래 입력 순서 위치에 바로 기록한다.
+        """
+        encoded = self.tokenizer(texts, truncation=True, max_length=self.max_length)
+        lengths = np.fromiter((len(ids) for ids in encoded['input_ids']), dtype=np.int64, count=len(texts))
+        order = np.argsort(lengths, kind='stable')
+        
+        embeddings = None
+        for start in range(0, len(order), self.batch_size):
+            batch_idx = order[start:start + self.batch_size]
+            bucket = _bucket_length(int(lengths[batch_idx[-1]]), self.max_length)
+            features = {key: [encoded[key][i] for i in batch_idx] for key in encoded.keys()}
+            inputs = self.tokenizer.pad(features, padding='max_length', max_length=bucket, return_tensors='np')
+            
+            outputs = self.model(**inputs)
+            pooled = self._mean_pooling(outputs.last_hidden_state, inputs['attention_mask'])
+            if embeddings is None:
+                embeddings = np.empty((len(texts), pooled.shape[1]), dtype=np.float32)
+            embeddings[batch_idx] = pooled
+        
+        embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._encode(list(texts)).tolist()
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode([text])[0].tolist()
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    embed_query 결과를 LRU로 캐싱하는 임베딩 래퍼
+    
+    쿼리 임베딩은 모델에만 의존하므로 벡터DB가 바뀌어도 무효화할 필요가 없다.
+    """
+    
+    def __init__(self, base: Embeddings, maxsize: int = 1024):
+        self.base = base
+        self._embed_query_cached = lru_cache(maxsize=maxsize)(self._embed_query)
+    
+    def _embed_query(self, text: str) -> Tuple[float, ...]:
+        return tuple(self.base.embed_query(text))
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.base.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return list(self._embed_query_cached(text.strip()))
+
+
+class SemanticSearchCache:
+    """
+    검색 결과 시맨틱 캐시
+    
+    쿼리 벡터를 faiss.IndexFlatIP에 보관하고, 코사인 유사도가 임계값 이상이면서
+    검색 조건(회사 필터, k)이 같은 이전 검색 결과를 재사용한다.
+    보고서가 추가되거나 DB가 초기화되면 clear()로 비워야 한다.
+    """
+    
+    # 유사 쿼리 후보 중 검색 조건이 같은 항목을 찾기 위해 조회할 후보 수
+    CANDIDATES = 8
+    
+    def __init__(self, capacity: int = 512, threshold: float = 0.97):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._index = None  # 첫 저장 시 차원에 맞춰 생성
+        self._entries = []  # [(검색 조건, 결과)] (인덱스 id 순서)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.lookups = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    def get(self, vector: np.ndarray, key: Tuple) -> Optional[List[Tuple[Document, float]]]:
+        """유사 쿼리의 캐시된 결과 조회 (없으면 None)"""
+        with self._lock:
+            self.lookups += 1
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            
+            scores, ids = self._index.search(vector.reshape(1, -1), min(self.CANDIDATES, self._index.ntotal))
+            for score, idx in zip(scores[0], ids[0]):
+                if idx < 0 or score < self.threshold:
+                    break
+                entry_key, results = self._entries[idx]
+                if entry_key == key:
+                    self.hits += 1
+                    return list(results)
+            return None
+    
+    def put(self, vector: np.ndarray, key: Tuple, results: List[Tuple[Document, float]]):
+        """검색 결과 저장 (용량이 차면 전체 비움)"""
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(vector.shape[0])
+            elif self._index.ntotal >= self.capacity:
+                self._clear_locked()
+            self._index.add(vector.reshape(1, -1))
+            self._entries.append((key, list(results)))
+    
+    def clear(self):
+        with self._lock:
+            self._clear_locked()
+    
+    def _clear_locked(self):
+        if self._index is not None:
+            self._index.reset()
+        self._entries.clear()
+
+
+class ArrowDocstore(Docstore, AddableMixin):
+    """
+    Arrow IPC 파일 기반 청크 docstore (pickle된 InMemoryDocstore 대체)
+    
+    저장된 청크는 열 단위 테이블(가능하면 메모리 맵)로 두고 조회된 행만 Document로 만든다.
+    새로 추가된 청크는 dict에 보관하다가 저장 시 테이블 뒤에 이어 붙인다.
+    테이블 행 순서는 FAISS 벡터 id 순서와 같다.
+    """
+    
+    # Document.metadata 중 별도 열로 저장하는 키 (나머지는 extra 열에 JSON으로)
+    METADATA_COLUMNS = ('rcept_no', 'report_name', 'company_name', 'report_date', 'report_type', 'added_at')
+    INT_METADATA_COLUMNS = ('chunk_index', 'total_chunks')
+    
+    def __init__(self, table):
+        self._table = table
+        self.base_ids: List[str] = table.column('doc_id').to_pylist()
+        self._row_by_id = {doc_id: row for row, doc_id in enumerate(self.base_ids)}
+        self._added: Dict[str, Document] = {}
+        self._deleted = set()
+        self._column_cache: Dict[str, List[Any]] = {}
+    
+    @classmethod
+    def schema(cls):
+        return pa.schema(
+            [('doc_id', pa.string()), ('text', pa.string())]
+            + [(name, pa.string()) for name in cls.METADATA_COLUMNS]
+            + [(name, pa.int32()) for name in cls.INT_METADATA_COLUMNS]
+            + [('extra', pa.string())]
+        )
+    
+    @classmethod
+    def documents_to_table(cls, doc_ids: List[str], docs: List[Document]):
+        """Document 리스트를 docstore 테이블로 변환"""
+        known = cls.METADATA_COLUMNS + cls.INT_METADATA_COLUMNS
+        columns = {
+            'doc_id': doc_ids,
+            'text': [doc.page_content for doc in docs],
+        }
+        for name in known:
+            columns[name] = [doc.metadata.get(name) for doc in docs]
+        columns['extra'] = [
+            _json_dumps(extra).decode('utf-8') if extra else None
+            for extra in ({k: v for k, v in doc.metadata.items() if k not in known} for doc in docs)
+        ]
+        return pa.table(columns, schema=cls.schema())
+    
+    def _row_document(self, row: int) -> Document:
+        record = self._table.slice(row, 1).to_pylist()[0]
+        metadata = {
+            name: record[name]
+            for name in self.METADATA_COLUMNS + self.INT_METADATA_COLUMNS
+            if record[name] is not None
+        }
+        if record['extra']:
+            metadata.update(_json_loads(record['extra']))
+        return Document(page_content=record['text'], metadata=metadata)
+    
+    def search(self, search: str) -> Union[str, Document]:
+        if search in self._added:
+            return self._added[search]
+        row = self._row_by_id.get(search)
+        if row is None or search in self._deleted:
+            return f"ID {search} not found."
+        return self._row_document(row)
+    
+    def add(self, texts: Dict[str, Document]) -> None:
+        overlapping = [doc_id for doc_id in texts if doc_id in self._added or (doc_id in self._row_by_id and doc_id not in self._deleted)]
+        if overlapping:
+            raise ValueError(f"Tried to add ids that already exist: {overlapping}")
+        self._added.update(texts)
+    
+    def delete(self, ids: List) -> None:
+        for doc_id in ids:
+            if doc_id in self._added:
+                del self._added[doc_id]
+            elif doc_id in self._row_by_id and doc_id not in self._deleted:
+                self._deleted.add(doc_id)
+            else:
+                raise ValueError(f"ID {doc_id} not found.")
+    
+    def metadata_field(self, doc_id: str, name: str) -> Any:
+        """Document를 만들지 않고 메타데이터 한 필드만 조회 (열 단위 캐시 사용)"""
+        if doc_id in self._added:
+            return self._added[doc_id].metadata.get(name)
+        row = self._row_by_id.get(doc_id)
+        if row is None or name not in self._table.column_names:
+            return None
+        if name not in self._column_cache:
+            self._column_cache[name] = self._table.column(name).to_pylist()
+        return self._column_cache[name][row]
+    
+    def to_table(self, doc_ids: List[str]):
+        """FAISS id 순서의 doc_id 목록으로 저장용 테이블 구성 (기존 행은 그대로 재사용)"""
+        base_count = len(self.base_ids)
+        if not self._deleted and doc_ids[:base_count] == self.base_ids:
+            new_ids = doc_ids[base_count:]
+            new_table = self.documents_to_table(new_ids, [self._added[doc_id] for doc_id in new_ids])
+            return pa.concat_tables([self._table, new_table])
+        return self.documents_to_table(doc_ids, [self.search(doc_id) for doc_id in doc_ids])
+    
+    def mark_saved(self, table, doc_ids: List[str]) -> None:
+        """
+        저장이 끝난 테이블을 기준 테이블로 교체 (다음 저장 때 같은 청크를 다시 이어 붙이지 않도록)
+        
+        Args:
+            table: to_table(doc_ids) 결과
+            doc_ids: 테이블 행 순서의 doc_id 목록
+        """
+        self._table = table
+        self.base_ids = doc_ids
+        self._row_by_id = {doc_id: row for row, doc_id in enumerate(doc_ids)}
+        # 스냅샷 이후 추가된 청크는 그대로 남김
+        for doc_id in doc_ids:
+            self._added.pop(doc_id, None)
+        self._deleted = {doc_id for doc_id in self._deleted if doc_id in self._row_by_id}
+        self._column_cache.clear()
+
 
 class VectorStore:
     """벡터 데이터베이스 관리 클래스"""
@@ -30,19 +414,25 @@ class VectorStore:
         """
         self.persist_directory = persist_directory or config.VECTOR_DB_DIR
         self.metadata_path = os.path.join(self.persist_directory, config.VECTOR_DB_METADATA_FILE)
+        # 보고서 원문은 메타데이터와 분리해 보고서별 파일로 저장
+        self.content_dir = os.path.join(self.persist_directory, "content")
         
         # 디렉토리 생성
         os.makedirs(self.persist_directory, exist_ok=True)
+        os.makedirs(self.content_dir, exist_ok=True)
         
         print("🔧 벡터 임베딩 모델 초기화 중...")
-        # 한국어 지원 임베딩 모델 사용 (config에서 설정)
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name=config.EMBEDDING_MODEL,
-            model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
-        )
+        self.embeddings = self._create_embeddings()
+        # FAISS 검색용 (쿼리 임베딩 LRU 캐시)
+        self.query_embeddings = CachedQueryEmbeddings(self.embeddings, maxsize=config.QUERY_EMBED_CACHE_SIZE)
         print("✅ 임베딩 모델 초기화 완료")
         
+        # 검색 결과 시맨틱 캐시
+        self._search_cache = (
+            SemanticSearchCache(config.SEARCH_CACHE_SIZE, config.SEARCH_CACHE_THRESHOLD)
+            if config.SEARCH_CACHE_SIZE > 0 else None
+        )
+        
         # 텍스트 분할기 설정 (config에서 설정)
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=config.CHUNK_SIZE,
@@ -53,41 +443,342 @@ class VectorStore:
         
         # FAISS 벡터스토어 로드 또는 생성
         self.vectorstore = self._load_or_create_vectorstore()
+        # 학습 실패 후 다시 학습을 시도할 벡터 수 (실패 시 현재 벡터 수의 2배)
+        self._train_retry_at = 0
+        
+        # 회사명(대문자) → FAISS 벡터 id 목록 (검색 시 IDSelector로 회사 필터를 FAISS에 위임)
+        self._chunk_ids_by_company: Dict[str, array] = {}
+        self._index_company_chunks()
         
         # 메타데이터 로드
         self.metadata = self._load_metadata()
         
+        # 메타데이터 조회용 인덱스 (변경 시 무효화, 조회 시 지연 생성)
+        self._by_company: Dict[str, List[str]] = {}
+        self._by_company_upper: Dict[str, List[str]] = {}
+        self._by_type: Dict[str, List[str]] = {}
+        self._name_lower: Dict[str, str] = {}
+        self._metadata_index_ready = False
+        
+        # 쓰기 지연(write-behind) 저장: 변경 시 이벤트만 켜고 백그라운드 스레드가 모아서 저장
+        self._dirty_count = 0  # 디스크에 아직 저장하지 않은 변경 수
+        self._write_lock = threading.RLock()  # 인덱스/메타데이터 변경과 저장용 스냅샷 직렬화
+        self._flush_lock = threading.Lock()  # 파일 저장 직렬화 (잠금 순서: _flush_lock → _write_lock)
+        self._dirty = threading.Event()
+        self._closed = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="VectorStoreFlush", daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.close)
+        
+        # 이전 형식(메타데이터 안의 full_content)을 원문 파일로 분리
+        self._migrate_inline_content()
+        
+    def _create_embeddings(self) -> Embeddings:
+        """config.EMBEDDING_BACKEND에 맞는 임베딩 모델 생성"""
+        if config.EMBEDDING_BACKEND.lower() == 'onnx':
+            return ONNXEmbeddings(config.EMBEDDING_MODEL, cache_dir=config.EMBEDDING_ONNX_DIR)
+        
+        device = self._select_device()
+        dtype = config.EMBEDDING_DTYPE.lower()
+        if dtype == 'auto':
+            dtype = 'float16' if device == 'cuda' else 'float32'
+        print(f"   장치: {device}, dtype: {dtype}")
+        
+        model_kwargs = {'device': device}
+        if dtype != 'float32':
+            # 반정밀도 가중치로 로드 (출력 임베딩은 float32로 변환되어 반환됨)
+            model_kwargs['model_kwargs'] = {'torch_dtype': dtype}
+        
+        # 한국어 지원 임베딩 모델 사용 (config에서 설정)
+        return HuggingFaceEmbeddings(
+            model_name=config.EMBEDDING_MODEL,
+            model_kwargs=model_kwargs,
+            encode_kwargs={
+                'normalize_embeddings': True,
+                'batch_size': 64 if device == 'cuda' else 16,
+                'convert_to_numpy': True
+            }
+        )
+    
+    @staticmethod
+    def _select_device() -> str:
+        """임베딩 추론 장치 선택 (config.EMBEDDING_DEVICE가 'auto'면 cuda → mps → cpu)"""
+        device = config.EMBEDDING_DEVICE.lower()
+        if device != 'auto':
+            return device
+        
+        try:
+            import torch
+        except ImportError:
+            return 'cpu'
+        
+        if torch.cuda.is_available():
+            return 'cuda'
+        mps = getattr(torch.backends, 'mps', None)
+        if mps is not None and mps.is_available():
+            return 'mps'
+        return 'cpu'
+    
     def _load_or_create_vectorstore(self) -> FAISS:
         """FAISS 벡터스토어 로드 또는 생성"""
+        # 검색 스레드 수 설정 (기본값에 맡기면 1개이거나 과다 할당되는 환경이 있음)
+        faiss.omp_set_num_threads(config.VECTOR_SEARCH_THREADS or max(1, (os.cpu_count() or 2) // 2))
+        
         index_path = os.path.join(self.persist_directory, "index.faiss")
+        arrow_path = os.path.join(self.persist_directory, "chunks.arrow")
         
         if os.path.exists(index_path):
             print(f"📂 기존 VectorDB 로드 중: {index_path}")
             try:
-                vectorstore = FAISS.load_local(
-                    self.persist_directory,
-                    self.embeddings,
-                    allow_dangerous_deserialization=True
-                )
+                if pa is not None and os.path.exists(arrow_path):
+                    # Arrow 청크 저장소: 메모리 맵으로 열어 pickle 역직렬화 없이 로드
+                    # (Windows는 매핑된 파일을 저장 시 교체할 수 없으므로 일반 파일로 읽음)
+                    source = pa.memory_map(arrow_path) if os.name != 'nt' else pa.OSFile(arrow_path)
+                    docstore = ArrowDocstore(pa.ipc.open_file(source).read_all())
+                    vectorstore = self._new_vectorstore(
+                        faiss.read_index(index_path),
+                        docstore,
+                        dict(enumerate(docstore.base_ids))
+                    )
+                else:
+                    vectorstore = FAISS.load_local(
+                        self.persist_directory,
+                        self.query_embeddings,
+                        allow_dangerous_deserialization=True
+                    )
+                self._apply_search_params(vectorstore.index)
                 print(f"✅ VectorDB 로드 완료")
                 return vectorstore
             except Exception as e:
                 print(f"⚠️  VectorDB 로드 실패: {e}")
                 print("   새로운 VectorDB를 생성합니다.")
         
-        # 새로운 벡터스토어 생성 (빈 문서로 초기화)
+        # 새로운 벡터스토어 생성 (더미 문서 없이 빈 인덱스로 시작)
         print("🆕 새로운 VectorDB 생성 중...")
-        initial_docs = [Document(page_content="초기 문서", metadata={"type": "init"})]
-        vectorstore = FAISS.from_documents(initial_docs, self.embeddings)
-        print("✅ VectorDB 생성 완료")
+        vectorstore = self._new_vectorstore(self._create_index(self._embedding_dimension()))
+        print(f"✅ VectorDB 생성 완료 ({type(vectorstore.index).__name__})")
         return vectorstore
     
+    def _embedding_dimension(self) -> int:
+        """임베딩 차원 (가능하면 모델 설정에서 읽어 임베딩 호출 없이 구함)"""
+        client = getattr(self.embeddings, 'client', None)
+        if hasattr(client, 'get_sentence_embedding_dimension'):
+            dim = client.get_sentence_embedding_dimension()
+            if dim:
+                return dim
+        
+        dim = getattr(self.embeddings, 'dimension', None)
+        if dim:
+            return dim
+        
+        return len(self.embeddings.embed_query("a"))
+    
+    def _new_vectorstore(
+        self,
+        index: faiss.Index,
+        docstore: Optional[InMemoryDocstore] = None,
+        index_to_docstore_id: Optional[Dict[int, str]] = None
+    ) -> FAISS:
+        """FAISS 인덱스를 docstore(기본: 빈 docstore)와 함께 LangChain 벡터스토어로 감싸기"""
+        return FAISS(
+            embedding_function=self.query_embeddings,
+            index=index,
+            docstore=docstore if docstore is not None else InMemoryDocstore({}),
+            index_to_docstore_id=index_to_docstore_id if index_to_docstore_id is not None else {}
+        )
+    
+    def _create_index(self, dim: int, train_vectors: Optional[np.ndarray] = None) -> faiss.Index:
+        """
+        config.VECTOR_INDEX_TYPE / VECTOR_QUANT_MODE에 맞는 FAISS 인덱스 생성
+        
+        IVF-PQ와 양자화 인덱스는 학습이 필요하므로, 학습 벡터가 부족하면 양자화 없는
+        인덱스로 시작하고 _prepare_trained_index()에서 충분한 벡터가 모이면 교체한다.
+        
+        Args:
+            dim: 임베딩 차원
+            train_vectors: 학습용 벡터 (float32)
+            
+        Returns:
+            faiss.Index: 비어 있는(학습 완료된) 인덱스
+        """
+        index_type = config.VECTOR_INDEX_TYPE.lower()
+        quant_mode = config.VECTOR_QUANT_MODE.lower()
+        min_train = self._min_train_vectors()
+        has_train_data = train_vectors is not None and len(train_vectors) >= min_train
+        
+        index = None
+        if index_type == 'ivfpq':
+            if has_train_data:
+                nlist = max(1, int(math.sqrt(len(train_vectors))))
+                index = faiss.index_factory(dim, f"IVF{nlist},PQ{_pq_subquantizers(dim)}x{PQ_NBITS}")
+        else:
+            codec = {'fp16': 'SQfp16', 'sq8': 'SQ8', 'pq': f"PQ{_pq_subquantizers(dim)}x{PQ_NBITS}"}.get(quant_mode)
+            graph = f"HNSW{config.VECTOR_HNSW_M}" if index_type == 'hnsw' else None
+            description = '_'.join(part for part in (graph, codec) if part) or 'Flat'
+            index = faiss.index_factory(dim, description)
+            if not index.is_trained and not has_train_data:
+                index = None
+        
+        if index is not None and not index.is_trained:
+            print(f"   🎓 인덱스 학습 중... ({type(index).__name__}, 벡터 {len(train_vectors):,}개)")
+            try:
+                index.train(train_vectors)
+            except RuntimeError as e:
+                print(f"   ⚠️  인덱스 학습 실패 → 양자화 없는 인덱스 사용: {e}")
+                index = None
+        
+        if index is None:
+            if not has_train_data:
+                print(f"   ℹ️  인덱스 학습 벡터 부족 (최소 {min_train:,}개) → 양자화 없는 인덱스로 시작")
+            index = faiss.IndexHNSWFlat(dim, config.VECTOR_HNSW_M) if index_type == 'hnsw' else faiss.IndexFlatL2(dim)
+        
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efConstruction = config.VECTOR_HNSW_EF_CONSTRUCTION
+        
+        self._apply_search_params(index)
+        return index
+    
+    @staticmethod
+    def _min_train_vectors() -> int:
+        """
+        config.VECTOR_TRAIN_MIN_VECTORS를 양자화기 학습 최소치 이상으로 보정
+        
+        PQ 코드북은 2**PQ_NBITS개 중심점을 k-means로 학습하므로 그보다 적은 벡터로는 학습이 실패한다.
+        IVF의 nlist는 sqrt(학습 벡터 수)로 정하므로 항상 학습 벡터 수 이하다.
+        """
+        if config.VECTOR_INDEX_TYPE.lower() == 'ivfpq' or config.VECTOR_QUANT_MODE.lower() == 'pq':
+            return max(config.VECTOR_TRAIN_MIN_VECTORS, 2 ** PQ_NBITS)
+        return max(config.VECTOR_TRAIN_MIN_VECTORS, 1)
+    
+    def _index_needs_training(self, index: faiss.Index) -> bool:
+        """config상 학습된 인덱스가 필요한데 아직 양자화 없는 임시 인덱스를 쓰고 있는지 여부"""
+        wants_trained = (
+            config.VECTOR_INDEX_TYPE.lower() == 'ivfpq'
+            or config.VECTOR_QUANT_MODE.lower() in ('sq8', 'pq')
+        )
+        return wants_trained and isinstance(index, (faiss.IndexFlat, faiss.IndexHNSWFlat))
+    
+    def _prepare_trained_index(self, new_vectors: np.ndarray) -> Optional[faiss.Index]:
+        """
+        새 벡터까지 합쳐 학습 기준을 넘으면 학습된(양자화) 교체 인덱스를 미리 생성
+        
+        self.vectorstore는 건드리지 않으므로 학습이 실패해도 기존 인덱스가 그대로 남는다.
+        반환된 인덱스에는 기존 벡터와 new_vectors가 같은 id 순서로 들어 있어서
+        LangChain docstore와 index_to_docstore_id 매핑은 그대로 쓸 수 있다.
+        
+        Args:
+            new_vectors: 이번에 추가할 벡터 (float32)
+            
+        Returns:
+            교체할 인덱스 (교체가 필요 없거나 학습에 실패하면 None)
+        """
+        index = self.vectorstore.index
+        total = index.ntotal + len(new_vectors)
+        if not self._index_needs_training(index) or total < max(self._min_train_vectors(), self._train_retry_at):
+            return None
+        
+        print(f"   🔄 벡터 {total:,}개 누적 → 학습된 인덱스 생성 중...")
+        vectors = np.vstack([index.reconstruct_n(0, index.ntotal), new_vectors]) if index.ntotal else new_vectors
+        trained_index = self._create_index(index.d, train_vectors=vectors)
+        if self._index_needs_training(trained_index):
+            # 학습 실패: 기존 인덱스 유지, 추가할 때마다 재학습하지 않도록 벡터가 두 배로 늘면 재시도
+            self._train_retry_at = total * 2
+            return None
+        
+        trained_index.add(vectors)
+        return trained_index
+    
+    def _apply_search_params(self, index: faiss.Index):
+        """검색 파라미터(HNSW efSearch, IVF nprobe)를 config 값으로 설정"""
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = config.VECTOR_HNSW_EF_SEARCH
+        
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            ivf.nprobe = config.VECTOR_IVF_NPROBE
+    
+    def _clear_search_cache(self):
+        """인덱스가 바뀌면 검색 결과 캐시 무효화"""
+        if self._search_cache is not None:
+            if self._search_cache.lookups:
+                print(f"   🧹 검색 캐시 비움 (적중률 {self._search_cache.hit_rate:.0%}, 조회 {self._search_cache.lookups}회)")
+            self._search_cache.clear()
+    
+    def _index_company_chunks(self):
+        """docstore를 한 번 훑어 회사별 FAISS 벡터 id 목록 생성 (이전 버전의 더미 문서 유무도 확인)"""
+        chunk_ids: Dict[str, array] = {}
+        docstore = self.vectorstore.docstore
+        for faiss_id, doc_id in self.vectorstore.index_to_docstore_id.items():
+            if isinstance(docstore, ArrowDocstore):
+                # 열 단위 조회 (청크마다 Document를 만들지 않음)
+                company = docstore.metadata_field(doc_id, 'company_name')
+            else:
+                doc = docstore.search(doc_id)
+                company = doc.metadata.get('company_name') if isinstance(doc, Document) else None
+            if company:
+                chunk_ids.setdefault(company.upper(), array('q')).append(faiss_id)
+        self._chunk_ids_by_company = chunk_ids
+        
+        # 이전 버전은 id 0에 더미 "초기 문서"를 넣었음
+        first_doc_id = self.vectorstore.index_to_docstore_id.get(0)
+        first_doc = docstore.search(first_doc_id) if first_doc_id is not None else None
+        self._has_init_doc = isinstance(first_doc, Document) and first_doc.metadata.get('type') == 'init'
+    
+    def _search_with_company_filter(
+        self,
+        query_vector: np.ndarray,
+        company_upper: str,
+        k: int
+    ) -> List[Tuple[Document, float]]:
+        """
+        회사 필터를 FAISS 탐색 단계에 적용한 유사도 검색
+        
+        해당 회사 청크의 벡터 id만 IDSelector로 허용하므로 과다 조회 후 걸러내지 않아도
+        정확히 k개를 얻는다. 선택자를 지원하지 않는 인덱스(PQ 등)는 k*3 조회 후 필터링한다.
+        """
+        # id 목록은 복사본으로 (원본 array의 버퍼를 검색 중에 노출하면 add_report의 extend가 BufferError)
+        # 인덱스/docstore는 잠금 안에서 한 번만 참조해 재구축·교체 중인 상태를 섞어 읽지 않음
+        with self._write_lock:
+            ids = self._chunk_ids_by_company.get(company_upper)
+            if not ids:
+                return []
+            id_array = np.array(ids, dtype=np.int64)
+            vectorstore = self.vectorstore
+        
+        index = vectorstore.index
+        selector = faiss.IDSelectorBatch(len(id_array), faiss.swig_ptr(id_array))
+        
+        if isinstance(index, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=max(config.VECTOR_HNSW_EF_SEARCH, k))
+        elif faiss.try_extract_index_ivf(index) is not None:
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=config.VECTOR_IVF_NPROBE)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        
+        try:
+            scores, faiss_ids = index.search(query_vector.reshape(1, -1), min(k, len(id_array)), params=params)
+        except RuntimeError:
+            # 선택자 미지원 인덱스: 더 많이 가져와서 필터링
+            results = vectorstore.similarity_search_with_score_by_vector(query_vector, k=k*3)
+            return [
+                (doc, score) for doc, score in results
+                if doc.metadata.get('company_name', '').upper() == company_upper
+            ][:k]
+        
+        docstore = vectorstore.docstore
+        index_to_docstore_id = vectorstore.index_to_docstore_id
+        return [
+            (docstore.search(index_to_docstore_id[faiss_id]), score)
+            for score, faiss_id in zip(scores[0].tolist(), faiss_ids[0].tolist())
+            if faiss_id != -1
+        ]
+    
     def _load_metadata(self) -> Dict:
         """메타데이터 로드"""
         if os.path.exists(self.metadata_path):
             try:
-                with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                with open(self.metadata_path, 'rb') as f:
+                    metadata = _json_loads(f.read())
                 print(f"📋 메타데이터 로드: {len(metadata)}개 보고서")
                 return metadata
             except Exception as e:
@@ -95,24 +786,250 @@ class VectorStore:
                 return {}
         return {}
     
-    def _save_metadata(self):
-        """메타데이터 저장"""
-        try:
-            with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, ensure_ascii=False, indent=2)
-            print(f"💾 메타데이터 저장 완료: {len(self.metadata)}개 보고서")
-        except Exception as e:
-            print(f"⚠️  메타데이터 저장 실패: {e}")
+    def _save_metadata(self, data: bytes):
+        """
+        메타데이터 저장 (임시 파일에 쓴 뒤 교체하여 저장 중단 시에도 기존 파일 보존)
+        
+        Args:
+            data: _json_dumps(self.metadata) 결과
+            
+        Raises:
+            OSError: 파일 쓰기 실패 (호출자가 재시도 여부 결정)
+        """
+        tmp_path = self.metadata_path + ".tmp"
+        # 들여쓰기 없이 바이트로 바로 기록
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.metadata_path)
     
-    def _save_vectorstore(self):
-        """벡터스토어 저장"""
-        try:
-            self.vectorstore.save_local(self.persist_directory)
-            print(f"💾 VectorDB 저장 완료: {self.persist_directory}")
-        except Exception as e:
-            print(f"⚠️  VectorDB 저장 실패: {e}")
+    def _snapshot_vectorstore(self) -> Dict[str, Any]:
+        """
+        저장할 벡터스토어 상태를 메모리에 복사 (self._write_lock을 잡은 상태에서 호출)
+        
+        인덱스는 faiss.serialize_index로 직렬화하고, 청크 저장소는 pyarrow가 있으면 Arrow 테이블
+        (기존 행은 복사 없이 재사용), 없으면 docstore/id 매핑의 얕은 복사본을 담는다.
+        
+        Returns:
+            _save_vectorstore()에 넘길 스냅샷
+        """
+        mapping = self.vectorstore.index_to_docstore_id
+        docstore = self.vectorstore.docstore
+        snapshot: Dict[str, Any] = {'index': faiss.serialize_index(self.vectorstore.index)}
+        if pa is not None:
+            doc_ids = [mapping[i] for i in range(len(mapping))]
+            if isinstance(docstore, ArrowDocstore):
+                snapshot['table'] = docstore.to_table(doc_ids)
+                snapshot['arrow_docstore'] = docstore
+                snapshot['doc_ids'] = doc_ids
+            else:
+                snapshot['table'] = ArrowDocstore.documents_to_table(doc_ids, [docstore.search(doc_id) for doc_id in doc_ids])
+        else:
+            snapshot['docstore'] = (InMemoryDocstore(dict(docstore._dict)), dict(mapping))
+        return snapshot
+    
+    def _save_vectorstore(self, snapshot: Dict[str, Any]):
+        """
+        벡터스토어 스냅샷 저장
+        
+        index.faiss와 청크 저장소(pyarrow가 있으면 chunks.arrow, 없으면 FAISS.save_local과 같은
+        index.pkl)를 임시 파일에 쓴 뒤 os.replace로 교체하여 깨진 파일이 남지 않게 한다.
+        
+        Args:
+            snapshot: _snapshot_vectorstore() 결과
+            
+        Raises:
+            Exception: 파일 쓰기/직렬화 실패 (호출자가 재시도 여부 결정)
+        """
+        index_path = os.path.join(self.persist_directory, "index.faiss")
+        pkl_path = os.path.join(self.persist_directory, "index.pkl")
+        arrow_path = os.path.join(self.persist_directory, "chunks.arrow")
+        
+        with open(index_path + ".tmp", 'wb') as f:
+            f.write(snapshot['index'])
+        
+        if 'table' in snapshot:
+            table = snapshot['table']
+            with pa.OSFile(arrow_path + ".tmp", 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            
+            os.replace(index_path + ".tmp", index_path)
+            os.replace(arrow_path + ".tmp", arrow_path)
+            # 이전 형식 파일 정리 (로드 시 chunks.arrow가 우선)
+            if os.path.exists(pkl_path):
+                os.remove(pkl_path)
+        else:
+            with open(pkl_path + ".tmp", 'wb') as f:
+                pickle.dump(snapshot['docstore'], f)
+            
+            os.replace(index_path + ".tmp", index_path)
+            os.replace(pkl_path + ".tmp", pkl_path)
     
-    def get_naver_reports_from_cache(self, company_name: str = None, report_type: str = "NAVER_COMPANY", industry_keywords: List[str] = None) -> List[Dict]:
+    def _mark_dirty(self, flush: bool = False):
+        """
+        변경 발생 표시 - 백그라운드 스레드가 VECTOR_FLUSH_DELAY 후 저장 (flush=True면 즉시 저장)
+        
+        Args:
+            flush: 즉시 저장 여부
+        """
+        with self._write_lock:
+            self._dirty_count += 1
+        if flush:
+            self._flush_now()
+        else:
+            self._dirty.set()
+    
+    def _flush_loop(self):
+        """변경 이벤트를 기다렸다가, 연속된 변경이 잠잠해지면 한 번에 저장하는 백그라운드 루프"""
+        while True:
+            self._dirty.wait()
+            if self._closed.is_set():
+                return
+            
+            # 디바운스: 대기 중 새 변경이 들어오면 다시 기다림
+            while True:
+                self._dirty.clear()
+                if self._closed.wait(config.VECTOR_FLUSH_DELAY) or not self._dirty.is_set():
+                    break
+            
+            self._flush_now()
+    
+    def _flush_now(self):
+        """
+        저장하지 않은 변경이 있으면 벡터스토어와 메타데이터를 함께 저장
+        
+        쓰기 잠금은 메모리 스냅샷을 만드는 동안만 잡고 파일 쓰기는 잠금 밖에서 하므로
+        저장 중에도 보고서 추가/조회가 막히지 않는다. 저장에 실패하면 변경 수를 그대로 두고
+        백그라운드 스레드가 VECTOR_FLUSH_DELAY 후 다시 시도한다.
+        """
+        with self._flush_lock:
+            try:
+                with self._write_lock:
+                    dirty_count = self._dirty_count
+                    if not dirty_count:
+                        return
+                    snapshot = self._snapshot_vectorstore()
+                    metadata_data = _json_dumps(self.metadata)
+                    report_count = len(self.metadata)
+                
+                self._save_vectorstore(snapshot)
+                self._save_metadata(metadata_data)
+            except Exception as e:
+                print(f"⚠️  VectorDB 저장 실패 (나중에 다시 시도): {e}")
+                self._dirty.set()
+                return
+            
+            with self._write_lock:
+                # 스냅샷 이후 들어온 변경은 다음 저장 때 반영
+                self._dirty_count -= dirty_count
+                # 저장한 테이블을 Arrow docstore의 기준 테이블로 (그 사이 재구축/초기화되지 않았을 때만)
+                docstore = snapshot.get('arrow_docstore')
+                if docstore is not None and docstore is self.vectorstore.docstore:
+                    docstore.mark_saved(snapshot['table'], snapshot['doc_ids'])
+        print(f"💾 VectorDB 저장 완료: {self.persist_directory} (보고서 {report_count}개)")
+    
+    def close(self):
+        """백그라운드 저장 스레드를 멈추고 남은 변경사항을 저장"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._dirty.set()  # 대기 중인 스레드 깨우기
+        self._flush_thread.join(timeout=30)
+        self._flush_now()
+    
+    def _content_path(self, rcept_no: str, compressed: bool) -> str:
+        """보고서 원문 파일 경로 (rcept_no를 파일명으로 안전하게 변환)"""
+        safe_name = re.sub(r'[^\w\-.]', '_', rcept_no)
+        return os.path.join(self.content_dir, safe_name + (".md.zst" if compressed else ".md"))
+    
+    def _write_content(self, rcept_no: str, content: str):
+        """보고서 원문 저장 (zstandard가 있으면 압축)"""
+        data = content.encode('utf-8')
+        compressed = zstandard is not None
+        if compressed:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+        
+        path = self._content_path(rcept_no, compressed)
+        with open(path + ".tmp", 'wb') as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    
+    def _read_content(self, rcept_no: str) -> Optional[str]:
+        """보고서 원문 로드 (없으면 None)"""
+        if zstandard is not None:
+            path = self._content_path(rcept_no, compressed=True)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return zstandard.ZstdDecompressor().decompress(f.read()).decode('utf-8')
+        
+        path = self._content_path(rcept_no, compressed=False)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read().decode('utf-8')
+        return None
+    
+    def _delete_content(self, rcept_no: str):
+        """보고서 원문 파일 삭제"""
+        for compressed in (True, False):
+            path = self._content_path(rcept_no, compressed)
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _migrate_inline_content(self):
+        """메타데이터에 포함된 full_content를 보고서별 원문 파일로 옮기고 메타데이터에서 제거"""
+        migrated = 0
+        for rcept_no, meta in self.metadata.items():
+            content = meta.pop('full_content', None)
+            if content is not None:
+                self._write_content(rcept_no, content)
+                migrated += 1
+        
+        if migrated:
+            print(f"📦 보고서 원문 {migrated}개를 메타데이터에서 분리 저장")
+            self._mark_dirty(flush=True)
+    
+    def _invalidate_metadata_index(self):
+        """메타데이터가 바뀌면 조회용 인덱스 무효화"""
+        self._metadata_index_ready = False
+    
+    def _ensure_metadata_index(self):
+        """
+        회사별(원본/대문자)/유형별 rcept_no 목록과 소문자 리포트명 인덱스를 필요할 때 한 번만 생성
+        
+        호출자가 self._write_lock을 잡은 상태에서 호출해야 한다 (생성 도중 메타데이터가 바뀌어
+        무효화 직후 이전 상태의 인덱스가 준비 완료로 표시되는 것을 방지).
+        """
+        if self._metadata_index_ready:
+            return
+        
+        by_company: Dict[str, List[str]] = {}
+        by_company_upper: Dict[str, List[str]] = {}
+        by_type: Dict[str, List[str]] = {}
+        name_lower: Dict[str, str] = {}
+        
+        for rcept_no, meta in self.metadata.items():
+            by_company.setdefault(meta.get('company_name'), []).append(rcept_no)
+            company_upper = meta.get('_company_upper')
+            if company_upper is None:
+                company_upper = meta.get('company_name', '').upper()
+            by_company_upper.setdefault(company_upper, []).append(rcept_no)
+            report_type = next((t for t in NAVER_REPORT_TYPES if rcept_no.startswith(t)), meta.get('report_type'))
+            by_type.setdefault(report_type, []).append(rcept_no)
+            name_lower[rcept_no] = meta.get('report_name', '').lower()
+        
+        self._by_company = by_company
+        self._by_company_upper = by_company_upper
+        self._by_type = by_type
+        self._name_lower = name_lower
+        self._metadata_index_ready = True
+    
+    def get_naver_reports_from_cache(
+        self,
+        company_name: str = None,
+        report_type: str = "NAVER_COMPANY",
+        industry_keywords: List[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
         VectorDB에서 증권사 리포트 조회 (캐싱)
         
@@ -120,6 +1037,7 @@ class VectorStore:
             company_name: 회사명 (종목분석용)
             report_type: "NAVER_COMPANY" (종목분석) 또는 "NAVER_INDUSTRY" (산업분석)
             industry_keywords: 산업 키워드 리스트 (산업분석용)
+            limit: 최신순 상위 N개만 반환 (None이면 전체)
             
         Returns:
             list: [{name, date, content, url}, ...] 형식의 리스트
@@ -130,59 +1048,55 @@ class VectorStore:
             print(f"🔍 VectorDB에서 산업분석 리포트 확인 중... (키워드: {industry_keywords})")
         
         try:
-            cached_reports = []
-            
-            if report_type == "NAVER_COMPANY":
-                # 종목분석: 회사명으로 검색
-                for rcept_no, meta in self.metadata.items():
-                    if rcept_no.startswith(report_type) and meta.get('company_name') == company_name:
-                        cached_reports.append({
-                            'name': meta.get('report_name', ''),
-                            'date': meta.get('date', ''),
-                            'content': meta.get('full_content', ''),
-                            'url': rcept_no,
-                            'rcept_no': rcept_no
-                        })
-            
-            elif report_type == "NAVER_INDUSTRY" and industry_keywords:
-                # 산업분석: 산업 키워드로 검색
-                for rcept_no, meta in self.metadata.items():
-                    if not rcept_no.startswith(report_type):
-                        continue
-                    
-                    report_name = meta.get('report_name', '')
-                    industry_tags = meta.get('industry_keywords', [])
-                    
-                    # 리포트명이나 산업 태그에 키워드가 포함되어 있는지 확인
-                    matched = False
-                    for keyword in industry_keywords:
-                        if keyword.lower() in report_name.lower():
-                            matched = True
-                            break
-                        if industry_tags and keyword in industry_tags:
-                            matched = True
-                            break
-                    
-                    if matched:
-                        cached_reports.append({
-                            'name': meta.get('report_name', ''),
-                            'date': meta.get('date', ''),
-                            'content': meta.get('full_content', ''),
-                            'url': rcept_no,
-                            'rcept_no': rcept_no
-                        })
-            
-            if cached_reports:
-                # 날짜 기준으로 정렬 (최신순)
-                def parse_date(date_str):
-                    try:
-                        if not date_str or date_str == "날짜미상":
-                            return "00.00.00"
-                        return date_str
-                    except:
-                        return "00.00.00"
+            matched_ids = []
+            selected = []
+            
+            # 조회 인덱스와 메타데이터를 같은 시점 기준으로 읽도록 쓰기 잠금 안에서 매칭/정렬
+            with self._write_lock:
+                self._ensure_metadata_index()
+                
+                if report_type == "NAVER_COMPANY":
+                    # 종목분석: 회사명으로 검색
+                    matched_ids = [
+                        rcept_no for rcept_no in self._by_company.get(company_name, [])
+                        if rcept_no.startswith(report_type)
+                    ]
+                
+                elif report_type == "NAVER_INDUSTRY" and industry_keywords:
+                    # 산업분석: 리포트명(소문자)은 키워드 정규식 한 번으로, 산업 태그는 집합 교집합으로 확인
+                    keyword_set = set(industry_keywords)
+                    pattern = re.compile('|'.join(
+                        re.escape(keyword) for keyword in sorted({k.lower() for k in keyword_set}, key=len, reverse=True)
+                    ))
+                    for rcept_no in self._by_type.get(report_type, []):
+                        industry_tags = self.metadata[rcept_no].get('industry_keywords')
+                        if pattern.search(self._name_lower[rcept_no]) or (industry_tags and not keyword_set.isdisjoint(industry_tags)):
+                            matched_ids.append(rcept_no)
                 
-                cached_reports.sort(key=lambda x: parse_date(x['date']), reverse=True)
+                if matched_ids:
+                    # 날짜 기준으로 정렬 (최신순) - 추가 시 저장해 둔 정렬 키 사용
+                    keyed = [
+                        (self.metadata[rcept_no].get('_date_sort_key') or _date_sort_key(self.metadata[rcept_no].get('date')), rcept_no)
+                        for rcept_no in matched_ids
+                    ]
+                    if limit is not None:
+                        keyed = heapq.nlargest(limit, keyed, key=itemgetter(0))
+                    else:
+                        keyed.sort(key=itemgetter(0), reverse=True)
+                    selected = [(self.metadata[rcept_no], rcept_no) for _, rcept_no in keyed]
+            
+            if matched_ids:
+                # 반환할 리포트만 구성하고 원문도 이 리포트들만 디스크에서 로드 (잠금 밖에서)
+                cached_reports = [
+                    {
+                        'name': meta.get('report_name', ''),
+                        'date': meta.get('date', ''),
+                        'content': self._read_content(rcept_no) or '',
+                        'url': rcept_no,
+                        'rcept_no': rcept_no
+                    }
+                    for meta, rcept_no in selected
+                ]
                 
                 print(f"   ✅ VectorDB에서 {len(cached_reports)}개 리포트 발견")
                 for idx, report in enumerate(cached_reports[:5], 1):
@@ -233,7 +1147,7 @@ class VectorStore:
         print(f"📖 캐시에서 보고서 로드: {report_info.get('report_name')}")
         
         # 저장된 원본 텍스트 반환
-        return report_info.get('full_content')
+        return self._read_content(rcept_no)
     
     def add_report(
         self,
@@ -267,45 +1181,68 @@ class VectorStore:
             chunks = self.text_splitter.split_text(content)
             print(f"   ✅ {len(chunks)}개 청크 생성됨")
             
-            # Document 객체 생성
-            documents = []
-            for i, chunk in enumerate(chunks):
-                doc = Document(
-                    page_content=chunk,
-                    metadata={
-                        "rcept_no": rcept_no,
-                        "report_name": report_name,
-                        "company_name": company_name,
-                        "report_date": report_date,
-                        "report_type": report_type,
-                        "chunk_index": i,
-                        "total_chunks": len(chunks),
-                        "added_at": datetime.now().isoformat()
-                    }
-                )
-                documents.append(doc)
-            
-            # 벡터스토어에 추가
+            # 미리 할당한 버퍼에 ADD_EMBED_BATCH개씩 임베딩을 바로 기록
             print("   🔄 벡터 임베딩 생성 및 FAISS 인덱스에 추가 중...")
-            self.vectorstore.add_documents(documents)
-            print("   ✅ 벡터 임베딩 완료")
-            
-            # 메타데이터 저장
-            self.metadata[rcept_no] = {
-                "report_name": report_name,
-                "company_name": company_name,
-                "date": report_date,
-                "report_type": report_type,
-                "num_chunks": len(chunks),
-                "content_length": len(content),
-                "full_content": content,  # 원본 텍스트도 저장
-                "industry_keywords": industry_keywords if industry_keywords else [],  # 산업 키워드
-                "added_at": datetime.now().isoformat()
-            }
+            vectors = np.empty((len(chunks), self.vectorstore.index.d), dtype=np.float32)
+            for start in range(0, len(chunks), ADD_EMBED_BATCH):
+                vectors[start:start + ADD_EMBED_BATCH] = self.embeddings.embed_documents(chunks[start:start + ADD_EMBED_BATCH])
             
-            # 디스크에 저장
-            self._save_vectorstore()
-            self._save_metadata()
+            with self._write_lock:
+                # 원문은 보고서별 파일로 저장 (메타데이터 저장 시 재직렬화되지 않도록)
+                # 디스크 쓰기가 실패해도 인덱스/docstore가 바뀌지 않도록 가장 먼저 기록
+                self._write_content(rcept_no, content)
+                
+                # 학습된 교체 인덱스는 공유 상태를 바꾸기 전에 준비 (학습 실패 시 기존 인덱스에 추가)
+                trained_index = self._prepare_trained_index(vectors)
+                
+                # 인덱스에 한 번에 추가하고 docstore/id 매핑은 직접 갱신 (LangChain의 중간 복사 생략)
+                first_id = self.vectorstore.index.ntotal
+                if trained_index is not None:
+                    self.vectorstore.index = trained_index
+                    print(f"   ✅ 인덱스 교체 완료: {type(trained_index).__name__}")
+                else:
+                    self.vectorstore.index.add(vectors)
+                
+                chunk_meta = {
+                    "rcept_no": rcept_no,
+                    "report_name": report_name,
+                    "company_name": company_name,
+                    "report_date": report_date,
+                    "report_type": report_type,
+                    "total_chunks": len(chunks),
+                    "added_at": datetime.now().isoformat()
+                }
+                doc_ids = [str(uuid.uuid4()) for _ in chunks]
+                self.vectorstore.docstore.add({
+                    doc_id: Document(page_content=chunk, metadata={**chunk_meta, "chunk_index": i})
+                    for i, (doc_id, chunk) in enumerate(zip(doc_ids, chunks))
+                })
+                self.vectorstore.index_to_docstore_id.update(enumerate(doc_ids, start=first_id))
+                
+                if company_name:
+                    self._chunk_ids_by_company.setdefault(company_name.upper(), array('q')).extend(
+                        range(first_id, first_id + len(chunks))
+                    )
+                self._clear_search_cache()
+                print("   ✅ 벡터 임베딩 완료")
+                
+                # 메타데이터 저장
+                self.metadata[rcept_no] = {
+                    "report_name": report_name,
+                    "company_name": company_name,
+                    "_company_upper": company_name.upper() if company_name else '',  # 대소문자 무시 조회용
+                    "date": report_date,
+                    "_date_sort_key": _date_sort_key(report_date),  # 최신순 정렬용
+                    "report_type": report_type,
+                    "num_chunks": len(chunks),
+                    "content_length": len(content),
+                    "industry_keywords": industry_keywords if industry_keywords else [],  # 산업 키워드
+                    "added_at": datetime.now().isoformat()
+                }
+                self._invalidate_metadata_index()
+                
+                # 디스크 저장은 백그라운드 스레드가 모아서 처리
+                self._mark_dirty()
             
             print(f"✅ VectorDB 추가 완료: {report_name}")
             
@@ -336,26 +1273,41 @@ class VectorStore:
             print(f"   회사 필터: {company_name}")
         
         try:
-            # 유사도 검색
-            results = self.vectorstore.similarity_search_with_score(query, k=k*3)  # 필터링 고려해서 더 많이 가져옴
+            query_vector = np.asarray(self.query_embeddings.embed_query(query), dtype=np.float32)
+            cache_key = (company_name.upper() if company_name else None, k)
+            
+            # 시맨틱 캐시 확인 (유사한 쿼리의 이전 검색 결과 재사용)
+            if self._search_cache is not None:
+                cached = self._search_cache.get(query_vector, cache_key)
+                if cached is not None:
+                    print(f"⚡ 검색 캐시 적중: {len(cached)}개 결과 (적중률 {self._search_cache.hit_rate:.0%})")
+                    return cached
             
-            # 회사명 필터링
+            # 유사도 검색 (회사명 필터는 FAISS 탐색 중에 적용)
             if company_name:
-                filtered_results = []
-                for doc, score in results:
-                    if doc.metadata.get('company_name', '').upper() == company_name.upper():
-                        filtered_results.append((doc, score))
-                results = filtered_results[:k]
+                results = self._search_with_company_filter(query_vector, company_name.upper(), k)
+            elif self._has_init_doc:
+                # 이전 버전에서 만든 인덱스의 더미 "초기 문서" 하나만큼 더 가져와서 제외
+                results = self.vectorstore.similarity_search_with_score_by_vector(query_vector, k=k + 1)
+                results = [(doc, score) for doc, score in results if doc.metadata.get('type') != 'init'][:k]
             else:
-                results = results[:k]
+                # 필터가 없으면 과다 조회 없이 k개만
+                results = self.vectorstore.similarity_search_with_score_by_vector(query_vector, k=k)
             
             print(f"✅ {len(results)}개 결과 발견")
             
-            # 결과 출력
-            for i, (doc, score) in enumerate(results, 1):
-                meta = doc.metadata
-                print(f"   [{i}] {meta.get('report_name')} ({meta.get('report_date')})")
-                print(f"       유사도: {score:.4f}, 청크: {meta.get('chunk_index')}/{meta.get('total_chunks')}")
+            if self._search_cache is not None:
+                self._search_cache.put(query_vector, cache_key, results)
+            
+            # 결과별 상세 출력은 DEBUG 로그에서만
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, (doc, score) in enumerate(results, 1):
+                    meta = doc.metadata
+                    logger.debug(
+                        "[%d] %s (%s) 유사도: %.4f, 청크: %s/%s",
+                        i, meta.get('report_name'), meta.get('report_date'),
+                        score, meta.get('chunk_index'), meta.get('total_chunks')
+                    )
             
             return results
             
@@ -365,6 +1317,51 @@ class VectorStore:
             traceback.print_exc()
             return []
     
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Tuple[Document, float]]]:
+        """
+        여러 쿼리를 한 번에 유사도 검색 (FAISS가 쿼리들을 병렬 처리)
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 반환할 문서 수
+            
+        Returns:
+            List[List[Tuple[Document, float]]]: 쿼리 순서대로 (문서, 유사도 점수) 리스트
+        """
+        if not queries:
+            return []
+        
+        print(f"🔍 VectorDB 일괄 검색 중: {len(queries)}개 쿼리")
+        
+        try:
+            query_vectors = np.asarray(
+                [self.query_embeddings.embed_query(query) for query in queries],
+                dtype=np.float32
+            )
+            scores, faiss_ids = self.vectorstore.index.search(query_vectors, k)
+            
+            docstore = self.vectorstore.docstore
+            index_to_docstore_id = self.vectorstore.index_to_docstore_id
+            all_results = []
+            for row_scores, row_ids in zip(scores.tolist(), faiss_ids.tolist()):
+                results = []
+                for score, faiss_id in zip(row_scores, row_ids):
+                    if faiss_id == -1:
+                        continue
+                    doc = docstore.search(index_to_docstore_id[faiss_id])
+                    if isinstance(doc, Document) and doc.metadata.get('type') != 'init':
+                        results.append((doc, score))
+                all_results.append(results)
+            
+            print(f"✅ 일괄 검색 완료: 총 {sum(len(r) for r in all_results)}개 결과")
+            return all_results
+            
+        except Exception as e:
+            print(f"❌ VectorDB 일괄 검색 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return [[] for _ in queries]
+    
     def get_all_reports_for_company(self, company_name: str) -> List[Dict]:
         """
         특정 회사의 모든 보고서 목록 가져오기
@@ -376,8 +1373,10 @@ class VectorStore:
             List[Dict]: 보고서 정보 리스트
         """
         reports = []
-        for rcept_no, info in self.metadata.items():
-            if info.get('company_name', '').upper() == company_name.upper():
+        with self._write_lock:
+            self._ensure_metadata_index()
+            for rcept_no in self._by_company_upper.get(company_name.upper(), []):
+                info = self.metadata[rcept_no]
                 reports.append({
                     'rcept_no': rcept_no,
                     'report_name': info.get('report_name'),
@@ -401,9 +1400,12 @@ class VectorStore:
             rcept_no: 접수번호
         """
         if rcept_no in self.metadata:
-            report_name = self.metadata[rcept_no].get('report_name')
-            del self.metadata[rcept_no]
-            self._save_metadata()
+            with self._write_lock:
+                report_name = self.metadata[rcept_no].get('report_name')
+                del self.metadata[rcept_no]
+                self._delete_content(rcept_no)
+                self._invalidate_metadata_index()
+            self._mark_dirty(flush=True)
             print(f"🗑️  보고서 삭제 완료: {report_name}")
             print("   ⚠️  주의: 벡터 인덱스는 재구축이 필요합니다.")
         else:
@@ -412,21 +1414,28 @@ class VectorStore:
     def rebuild_index(self):
         """
         벡터 인덱스 재구축 (메타데이터 기반)
+        
+        보고서를 분할하면서 REBUILD_EMBED_BATCH개씩 임베딩 스레드에 넘겨 분할과 임베딩을
+        겹쳐 실행하고, 모인 벡터로 인덱스를 학습/구성한 뒤 docstore를 한 번에 만든다.
         """
         print("🔄 벡터 인덱스 재구축 중...")
         
-        all_documents = []
-        for rcept_no, info in self.metadata.items():
-            content = info.get('full_content', '')
-            if not content:
-                continue
-            
-            chunks = self.text_splitter.split_text(content)
-            
-            for i, chunk in enumerate(chunks):
-                doc = Document(
-                    page_content=chunk,
-                    metadata={
+        texts = []
+        metadatas = []
+        futures = []
+        submitted = 0
+        
+        with ThreadPoolExecutor(max_workers=1) as encoder:
+            for rcept_no, info in self.metadata.items():
+                content = self._read_content(rcept_no)
+                if not content:
+                    continue
+                
+                chunks = self.text_splitter.split_text(content)
+                
+                for i, chunk in enumerate(chunks):
+                    texts.append(chunk)
+                    metadatas.append({
                         "rcept_no": rcept_no,
                         "report_name": info.get('report_name'),
                         "company_name": info.get('company_name'),
@@ -435,14 +1444,39 @@ class VectorStore:
                         "chunk_index": i,
                         "total_chunks": len(chunks),
                         "added_at": info.get('added_at')
-                    }
-                )
-                all_documents.append(doc)
+                    })
+                
+                while len(texts) - submitted >= REBUILD_EMBED_BATCH:
+                    futures.append(encoder.submit(self.embeddings.embed_documents, texts[submitted:submitted + REBUILD_EMBED_BATCH]))
+                    submitted += REBUILD_EMBED_BATCH
+            
+            if submitted < len(texts):
+                futures.append(encoder.submit(self.embeddings.embed_documents, texts[submitted:]))
+            
+            if texts:
+                print(f"   총 {len(texts)}개 청크 임베딩 중...")
+            vectors = [np.asarray(future.result(), dtype=np.float32) for future in futures]
         
-        if all_documents:
-            print(f"   총 {len(all_documents)}개 청크 재구축 중...")
-            self.vectorstore = FAISS.from_documents(all_documents, self.embeddings)
-            self._save_vectorstore()
+        if texts:
+            vectors = np.ascontiguousarray(np.concatenate(vectors))
+            
+            # IVF-PQ/양자화 인덱스는 전체 임베딩으로 학습한 뒤 나눠서 추가
+            index = self._create_index(vectors.shape[1], train_vectors=vectors)
+            for start in range(0, len(vectors), INDEX_ADD_BATCH):
+                index.add(vectors[start:start + INDEX_ADD_BATCH])
+            
+            ids = [str(uuid.uuid4()) for _ in texts]
+            docstore = InMemoryDocstore({
+                doc_id: Document(page_content=text, metadata=metadata)
+                for doc_id, text, metadata in zip(ids, texts, metadatas)
+            })
+            with self._write_lock:
+                self.vectorstore = self._new_vectorstore(index, docstore, dict(enumerate(ids)))
+                self._train_retry_at = 0
+                self._index_company_chunks()
+                
+                self._clear_search_cache()
+            self._mark_dirty(flush=True)
             print("✅ 벡터 인덱스 재구축 완료")
         else:
             print("⚠️  재구축할 문서가 없습니다.")
@@ -497,25 +1531,42 @@ class VectorStore:
         try:
             print(f"🗑️  VectorDB 초기화 중...")
             
-            # 1. 메타데이터 초기화
-            self.metadata = {}
-            self._save_metadata()
-            print(f"   ✅ 메타데이터 초기화 완료")
-            
-            # 2. 저장된 파일들 삭제
-            faiss_index_path = os.path.join(self.persist_directory, "index.faiss")
-            faiss_pkl_path = os.path.join(self.persist_directory, "index.pkl")
-            
-            if os.path.exists(faiss_index_path):
-                os.remove(faiss_index_path)
-                print(f"   ✅ FAISS 인덱스 파일 삭제")
-            
-            if os.path.exists(faiss_pkl_path):
-                os.remove(faiss_pkl_path)
-                print(f"   ✅ FAISS PKL 파일 삭제")
-            
-            # 3. VectorStore 재초기화
-            self.vectorstore = self._load_or_create_vectorstore()
+            # 진행 중인 저장이 삭제한 파일을 다시 쓰지 않도록 저장 잠금도 함께 잡음
+            with self._flush_lock, self._write_lock:
+                # 1. 메타데이터 초기화
+                self.metadata = {}
+                self._invalidate_metadata_index()
+                self._save_metadata(_json_dumps(self.metadata))
+                self._dirty_count = 0
+                print(f"   ✅ 메타데이터 초기화 완료")
+                
+                # 2. 저장된 파일들 삭제
+                faiss_index_path = os.path.join(self.persist_directory, "index.faiss")
+                faiss_pkl_path = os.path.join(self.persist_directory, "index.pkl")
+                chunks_arrow_path = os.path.join(self.persist_directory, "chunks.arrow")
+                
+                if os.path.exists(faiss_index_path):
+                    os.remove(faiss_index_path)
+                    print(f"   ✅ FAISS 인덱스 파일 삭제")
+                
+                if os.path.exists(faiss_pkl_path):
+                    os.remove(faiss_pkl_path)
+                    print(f"   ✅ FAISS PKL 파일 삭제")
+                
+                if os.path.exists(chunks_arrow_path):
+                    os.remove(chunks_arrow_path)
+                    print(f"   ✅ 청크 저장소(Arrow) 파일 삭제")
+                
+                if os.path.exists(self.content_dir):
+                    shutil.rmtree(self.content_dir)
+                os.makedirs(self.content_dir, exist_ok=True)
+                print(f"   ✅ 보고서 원문 파일 삭제")
+                
+                # 3. VectorStore 재초기화
+                self.vectorstore = self._load_or_create_vectorstore()
+                self._train_retry_at = 0
+                self._index_company_chunks()
+                self._clear_search_cache()
             
             print(f"✅ VectorDB 초기화 완료!")
             return True